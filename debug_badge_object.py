@@ -3,15 +3,17 @@
 Debug script to examine the BadgeObject definition.
 """
 
-import json
 from pathlib import Path
 
+# Reuse the cached loader and printer from the TplSchema debug script
+from debug_schema import _load_schema, _pretty
+
+
 def main():
     schema_path = Path("schema/schema_simplified.json")
 
     print("Loading schema...")
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    schema = _load_schema(str(schema_path.resolve()))
 
     # Find BadgeObject definition
     badge_object = schema['definitions'].get('BadgeObject', {})
@@ -23,7 +25,8 @@ def main():
             properties = badge_object['properties']
             for prop_name, prop_def in properties.items():
                 print(f"\n{prop_name} property:")
-                print(json.dumps(prop_def, indent=2))
+                print(_pretty(prop_def))
+
 
 if __name__ == "__main__":
     main()
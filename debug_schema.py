@@ -3,14 +3,34 @@
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional for debugging
+    orjson = None
+
+
+@lru_cache(maxsize=4)
+def _load_schema(path: str) -> dict:
+    """Load and parse a schema file, caching the result per resolved path."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _pretty(obj) -> str:
+    """Pretty-print a JSON-compatible object for debug output."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def main():
     schema_path = Path("schema/schema_simplified.json")
 
     print("Loading schema...")
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    schema = _load_schema(str(schema_path.resolve()))
 
     # Find TplSchema definition
     tpl_schema = schema['definitions'].get('TplSchema', {})
@@ -31,14 +51,14 @@ def main():
                     badge_prop = properties_item['properties'].get('badge')
                     if badge_prop:
                         print(f"\nBadge property structure:")
-                        print(json.dumps(badge_prop, indent=2))
+                        print(_pretty(badge_prop))
 
                         # Check for any nested text properties
                         if isinstance(badge_prop, dict) and 'properties' in badge_prop:
                             text_prop = badge_prop['properties'].get('text')
                             if text_prop:
                                 print(f"\nText property structure:")
-                                print(json.dumps(text_prop, indent=2))
+                                print(_pretty(text_prop))
                     else:
                         print("No badge property found in TplSchema properties")
                 else:
@@ -54,5 +74,6 @@ def main():
         tpl_related = [k for k in definitions.keys() if 'tpl' in k.lower()]
         print(f"TPL-related definitions: {tpl_related}")
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Basic FastAPI + AMIS example.
+
+Serves AMIS page schemas as JSON and an interactive viewer that renders them
+with the AMIS SDK. Run with:
+
+    uv run python examples/basic_example.py
+
+Then open http://localhost:8000/viewer in a browser.
+
+The schemas below are trusted, hard-coded constants, so they are serialized
+once at import time and served as raw JSON bytes without any per-request
+validation. When building trusted payloads with the generated AMIS models,
+prefer ``Model.model_construct(**data)`` over ``Model(**data)`` to skip
+re-running field validation on data that is already known to be valid, and
+return the serialized result directly instead of declaring a
+``response_model``.
+"""
+
+from typing import Any, Callable, Coroutine, Dict
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRoute(APIRoute):
+    """Route that decodes JSON request bodies with orjson."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            body = await request.body()
+            if body:
+                try:
+                    # Starlette's Request.json() returns this cached value
+                    request._json = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Leave invalid bodies to FastAPI's own error handling
+                    pass
+            return await route_handler(request)
+
+        return orjson_route_handler
+
+
+app = FastAPI(
+    title="FastAPI-AMIS-Admin Example",
+    description="Example application serving AMIS schemas",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
+app.router.route_class = ORJSONRoute
+
+_PAGE_PAYLOAD: Dict[str, Any] = {
+    "type": "page",
+    "title": "User Registration",
+    "body": [
+        {
+            "type": "form",
+            "title": "Register",
+            "api": "post:/api/submit",
+            "body": [
+                {"type": "input-text", "name": "username", "label": "Username", "required": True},
+                {"type": "input-email", "name": "email", "label": "Email", "required": True},
+                {"type": "input-password", "name": "password", "label": "Password", "required": True},
+            ],
+        }
+    ],
+}
+
+_FORM_PAYLOAD: Dict[str, Any] = {
+    "type": "page",
+    "title": "Advanced Form",
+    "body": [
+        {
+            "type": "form",
+            "api": "post:/api/submit",
+            "body": [
+                {"type": "input-text", "name": "name", "label": "Name", "required": True},
+                {"type": "input-number", "name": "age", "label": "Age", "min": 0, "max": 150},
+                {
+                    "type": "select",
+                    "name": "role",
+                    "label": "Role",
+                    "options": [
+                        {"label": "Admin", "value": "admin"},
+                        {"label": "Editor", "value": "editor"},
+                        {"label": "Viewer", "value": "viewer"},
+                    ],
+                },
+                {"type": "switch", "name": "active", "label": "Active"},
+                {"type": "input-date", "name": "birthday", "label": "Birthday"},
+                {"type": "textarea", "name": "bio", "label": "Bio"},
+            ],
+        }
+    ],
+}
+
+_TABLE_PAYLOAD: Dict[str, Any] = {
+    "type": "page",
+    "title": "User Management",
+    "body": [
+        {
+            "type": "crud",
+            "api": "/api/users",
+            "columns": [
+                {"name": "id", "label": "ID"},
+                {"name": "username", "label": "Username"},
+                {"name": "email", "label": "Email"},
+                {"name": "role", "label": "Role"},
+                {
+                    "type": "operation",
+                    "label": "Actions",
+                    "buttons": [
+                        {"type": "button", "label": "Edit", "actionType": "dialog", "dialog": {"title": "Edit"}},
+                        {"type": "button", "label": "Delete", "level": "danger", "actionType": "ajax"},
+                    ],
+                },
+            ],
+        }
+    ],
+}
+
+_USERS_PAYLOAD: Dict[str, Any] = {
+    "status": 0,
+    "msg": "",
+    "data": {
+        "items": [
+            {"id": 1, "username": "admin", "email": "admin@example.com", "role": "admin"},
+            {"id": 2, "username": "editor", "email": "editor@example.com", "role": "editor"},
+            {"id": 3, "username": "viewer", "email": "viewer@example.com", "role": "viewer"},
+        ],
+        "total": 3,
+    },
+}
+
+# Static payloads are serialized once at import time.
+_PAGE_BYTES = orjson.dumps(_PAGE_PAYLOAD)
+_FORM_BYTES = orjson.dumps(_FORM_PAYLOAD)
+_TABLE_BYTES = orjson.dumps(_TABLE_PAYLOAD)
+_USERS_BYTES = orjson.dumps(_USERS_PAYLOAD)
+
+_VIEWER_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8" />
+    <title>AMIS Viewer</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <link rel="stylesheet" href="https://unpkg.com/amis@latest/sdk/sdk.css" />
+    <link rel="stylesheet" href="https://unpkg.com/amis@latest/sdk/helper.css" />
+    <script src="https://unpkg.com/amis@latest/sdk/sdk.js"></script>
+</head>
+<body>
+    <div id="root"></div>
+    <script>
+        (function () {
+            const amis = amisRequire("amis/embed");
+            const path = new URLSearchParams(window.location.search).get("schema") || "/page";
+            fetch(path)
+                .then((response) => response.json())
+                .then((schema) => amis.embed("#root", schema));
+        })();
+    </script>
+</body>
+</html>
+"""
+_VIEWER_BYTES = _VIEWER_HTML.encode("utf-8")
+
+
+def _json_response(data: bytes, status_code: int = 200) -> Response:
+    """Wrap pre-serialized JSON bytes in a response."""
+    return Response(content=data, status_code=status_code, media_type="application/json")
+
+
+@app.get("/", response_model=None, response_class=ORJSONResponse)
+async def root() -> ORJSONResponse:
+    """List available endpoints."""
+    return ORJSONResponse(
+        content={
+            "message": "FastAPI-AMIS-Admin Example",
+            "endpoints": {
+                "page": "/page",
+                "form": "/form",
+                "table": "/table",
+                "viewer": "/viewer",
+                "users": "/api/users",
+            },
+        }
+    )
+
+
+@app.get("/page")
+async def get_page() -> Response:
+    """User registration page."""
+    return _json_response(_PAGE_BYTES)
+
+
+@app.get("/form")
+async def get_form() -> Response:
+    """Advanced form with various input types."""
+    return _json_response(_FORM_BYTES)
+
+
+@app.get("/table")
+async def get_table() -> Response:
+    """CRUD table with user management."""
+    return _json_response(_TABLE_BYTES)
+
+
+@app.get("/viewer", response_class=HTMLResponse)
+async def get_viewer() -> Response:
+    """Interactive AMIS viewer rendering the /page schema."""
+    return Response(content=_VIEWER_BYTES, media_type="text/html; charset=utf-8")
+
+
+@app.post("/api/submit", response_model=None, response_class=ORJSONResponse)
+async def submit_form(data: Dict[str, Any]) -> ORJSONResponse:
+    """Mock form submission."""
+    return ORJSONResponse(content={"status": 0, "msg": "Success", "data": data})
+
+
+@app.get("/api/users")
+async def get_users() -> Response:
+    """Mock user list for the CRUD table."""
+    return _json_response(_USERS_BYTES)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -4,9 +4,42 @@ AMIS module - Auto-generated Pydantic models.
 This module provides type-safe Pydantic models for all AMIS components,
 automatically generated from the AMIS JSON Schema.
 
+Models are loaded lazily: the generated module is only imported the first
+time one of its names is accessed. The list of available names comes from
+``_manifest.txt``, which is written alongside the generated models; a name
+missing from a stale manifest is still looked up in the generated module.
+
 To regenerate models:
     uv run update-amis-models
 """
 
-# Import all auto-generated models (452 models from simplified schema)
-from .auto_generated_models import *
+import importlib
+from pathlib import Path
+
+# Names of the auto-generated models (452 models from simplified schema)
+__all__ = (Path(__file__).parent / "_manifest.txt").read_text(encoding="utf-8").split()
+_LAZY_NAMES = frozenset(__all__)
+
+
+def _models():
+    return importlib.import_module(".auto_generated_models", __name__)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        # Bind every model at once so later lookups never reach this hook
+        module = _models()
+        globals().update({n: getattr(module, n) for n in _LAZY_NAMES if hasattr(module, n)})
+        if name in globals():
+            return globals()[name]
+    elif not name.startswith("_"):
+        # The models may have been regenerated without rewriting the manifest
+        module = _models()
+        if hasattr(module, name):
+            globals()[name] = getattr(module, name)
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(_LAZY_NAMES | globals().keys())
@@ -1,55 +1,141 @@
 import json
-import jsonref
+import os
+import orjson
+import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import subprocess
+import sys
+
+from datamodel_code_generator.__main__ import Exit, main as codegen_main
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 SCHEMA_FILE = Path("schema.json")
 OUTPUT_DIR = Path("schemas")
 OUTPUT_DIR.mkdir(exist_ok=True)
+DEFS_DIR = OUTPUT_DIR / "defs"
 MODELS_FILE = Path("models.py")
+# Розгортати $ref у файлах окремих $defs лише на вимогу (--deref-defs)
+DEREF_DEFS = "--deref-defs" in sys.argv
+# Додатково зберігати відформатовану копію bundled JSON (--pretty)
+PRETTY = "--pretty" in sys.argv
 
-# --- Завантаження та розгортання схеми ---
+
+# --- Завантаження схеми ---
 with open(SCHEMA_FILE, "r", encoding="utf-8") as f:
     base_schema = json.load(f)
 
-# Використовуємо jsonref для автоматичного вирішення $ref
-schema = jsonref.replace_refs(base_schema, base_uri=f"file://{SCHEMA_FILE.resolve()}")
+# $ref, які зараз розгортаються (для розриву циклів)
+_resolving = set()
+# Посилання на цілі визначення лишаються як $ref: datamodel-codegen розв'язує їх сам
+DEFINITION_REF = re.compile(r"#/(?:definitions|\$defs)/[^/]+")
+# Bundled JSON не повинен бути значно більшим за вихідну схему
+MAX_BUNDLE_GROWTH = 2
+
+
+def _lookup(ref):
+    """Знаходить вузол за локальним JSON-pointer ('#/definitions/Name/...')."""
+    node = base_schema
+    for part in ref[2:].split("/"):
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def _expand(ref, inline_definitions):
+    """Розгортає один локальний $ref; нерозв'язні посилання лишаються як є."""
+    try:
+        node = _lookup(ref)
+    except (KeyError, IndexError, TypeError):
+        print(f"⚠️ Unresolvable $ref left as is: {ref}")
+        return {"$ref": ref}
+    _resolving.add(ref)
+    try:
+        return _deref(node, inline_definitions)
+    finally:
+        _resolving.discard(ref)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_ref(ref):
+    """Повністю розгортає $ref один раз; усі місця посилання отримують спільний результат (лише для --deref-defs)."""
+    return _expand(ref, inline_definitions=True)
+
+
+def _deref(node, inline_definitions=False):
+    """
+    Розгортає $ref у вузлі. За замовчуванням посилання на цілі визначення
+    зберігаються, а вбудовуються лише глибші pointer-и; циклічні посилання лишаються як $ref.
+    """
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/") and ref not in _resolving:
+            if inline_definitions:
+                return _resolve_ref(ref)
+            if not DEFINITION_REF.fullmatch(ref):
+                return _expand(ref, inline_definitions=False)
+        return {key: _deref(value, inline_definitions) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_deref(item, inline_definitions) for item in node]
+    return node
+
+
+def _write_def(item):
+    """Записує одне визначення у DEFS_DIR як JSON та YAML."""
+    name, content = item
+    (DEFS_DIR / f"{name}.json").write_bytes(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+    with open(DEFS_DIR / f"{name}.yaml", "w", encoding="utf-8") as f:
+        yaml.dump(content, f, Dumper=SafeDumper, sort_keys=False)
+
+
+# Кореневий $ref і definitions зберігаються, розгортається лише їх вміст
+schema = {key: _deref(value) for key, value in base_schema.items()}
 
 # --- Збереження повної bundled JSON ---
+# Компактний JSON читає лише datamodel-codegen, тому без відступів
 bundled_json_file = OUTPUT_DIR / "schema-bundled.json"
-with open(bundled_json_file, "w", encoding="utf-8") as f:
-    json.dump(schema, f, indent=2)
+bundled = orjson.dumps(schema)
+# Спільні розгорнуті піддерева при серіалізації множаться; не пишемо такий bundle
+max_size = MAX_BUNDLE_GROWTH * SCHEMA_FILE.stat().st_size
+if len(bundled) > max_size:
+    sys.exit(f"❌ Bundled JSON is {len(bundled)} bytes, over the {max_size} byte limit")
+bundled_json_file.write_bytes(bundled)
 print(f"✅ Bundled JSON saved: {bundled_json_file}")
+if PRETTY:
+    pretty_json_file = OUTPUT_DIR / "schema-bundled.pretty.json"
+    pretty_json_file.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+    print(f"✅ Pretty bundled JSON saved: {pretty_json_file}")
 
 # --- Конвертація в YAML ---
 bundled_yaml_file = OUTPUT_DIR / "schema-bundled.yaml"
 with open(bundled_yaml_file, "w", encoding="utf-8") as f:
-    yaml.safe_dump(schema, f, sort_keys=False)
+    yaml.dump(schema, f, Dumper=SafeDumper, sort_keys=False)
 print(f"✅ Bundled YAML saved: {bundled_yaml_file}")
 
 # --- Розбивка $defs / $components ---
-defs = schema.get("$defs") or schema.get("definitions")
+# За замовчуванням пишемо оригінальні (не розгорнуті) визначення
+defs = base_schema.get("$defs") or base_schema.get("definitions")
+if defs and DEREF_DEFS:
+    defs = {name: _deref(content, inline_definitions=True) for name, content in defs.items()}
 if defs:
-    defs_dir = OUTPUT_DIR / "defs"
-    defs_dir.mkdir(exist_ok=True)
-    for name, content in defs.items():
-        file_json = defs_dir / f"{name}.json"
-        file_yaml = defs_dir / f"{name}.yaml"
-        with open(file_json, "w", encoding="utf-8") as f:
-            json.dump(content, f, indent=2)
-        with open(file_yaml, "w", encoding="utf-8") as f:
-            yaml.safe_dump(content, f, sort_keys=False)
+    DEFS_DIR.mkdir(exist_ok=True)
+    # Сотні дрібних файлів: запис розподіляємо між потоками
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        list(executor.map(_write_def, defs.items()))
     print(f"✅ Split $defs into {len(defs)} files")
 
-# --- Виклик datamodel-code-generator ---
-cmd = [
-    "datamodel-codegen",
+# --- Виклик datamodel-code-generator (у цьому ж процесі, без запуску нового інтерпретатора) ---
+args = [
     "--input", str(bundled_json_file),
     "--output", str(MODELS_FILE),
     "--reuse-model"
 ]
 
 print("🔹 Running datamodel-code-generator...")
-subprocess.run(cmd, check=True)
+if codegen_main(args) != Exit.OK:
+    sys.exit("❌ datamodel-code-generator failed")
 print(f"✅ Models generated at {MODELS_FILE}")
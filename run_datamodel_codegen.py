@@ -1,26 +1,51 @@
+import ast
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from datamodel_code_generator.__main__ import main as codegen_main
 from pydantic import BaseModel
 
+_TPCS_START = b"class TransferPickerControlSchema(BaseModel):\n"
+_TPCS_END = b"    pickerSize: Any | None = None\n"
+_TPCS_REPLACEMENT = (
+    "class TransferPickerControlSchema(BaseTransferControlSchema, SpinnerExtraProps):\n"
+    "    type: Literal['transfer-picker'] = Field(\n"
+    "        ..., description='TransferPicker 穿梭器的弹框形态 文档：https://aisuda.bce.baidu.com/amis/zh-CN/components/form/transfer-picker'\n"
+    "    )\n"
+    "    borderMode: BorderMode | None = Field(None, description='边框模式，全边框，还是半边框，或者没边框。')\n"
+    "    pickerSize: Size | None = Field(None, description='弹窗大小')\n"
+).encode("utf-8")
+
+_OUTPUT_RE = re.compile(r"^--output=(?P<value>.+)$")
+_SCHEMA_TYPE_NAME = re.compile(rb"\bSchemaType\b")
+
 
 def _patched_deepcopy(self: BaseModel, memo: dict[int, Any] | None = None) -> BaseModel:
     """Avoid fully-recursive deepcopy to prevent excessive memory usage."""
 
-    # Reuse BaseModel.copy to produce a shallow copy. This is sufficient for
-    # datamodel-code-generator, which only needs independent instances of the
-    # models without recursively cloning every nested object.
-    clone = self.copy(deep=False)
+    # Build a shallow clone directly rather than through BaseModel.copy, which
+    # goes through pydantic's copy machinery for every model seen during code
+    # generation. This is sufficient for datamodel-code-generator, which only
+    # needs independent instances of the models without recursively cloning
+    # every nested object.
+    clone = object.__new__(type(self))
+    object.__setattr__(clone, "__dict__", self.__dict__.copy())
+    object.__setattr__(clone, "__pydantic_fields_set__", self.__pydantic_fields_set__.copy())
+    extra = self.__pydantic_extra__
+    object.__setattr__(clone, "__pydantic_extra__", None if extra is None else extra.copy())
+    private = getattr(self, "__pydantic_private__", None)
+    object.__setattr__(clone, "__pydantic_private__", None if private is None else private.copy())
     if memo is None:
         memo = {}
     memo[id(self)] = clone
     return clone
 
 
-def _extract_output_path(args: list[str]) -> Path | None:
+@lru_cache(maxsize=8)
+def _extract_output_path(args: tuple[str, ...]) -> Path | None:
     """Extract the `--output` path from datamodel-code-generator CLI args."""
 
     if "--output" in args:
@@ -30,9 +55,8 @@ def _extract_output_path(args: list[str]) -> Path | None:
         except IndexError:
             return None
 
-    pattern = re.compile(r"^--output=(?P<value>.+)$")
     for arg in args:
-        match = pattern.match(arg)
+        match = _OUTPUT_RE.match(arg)
         if match:
             return Path(match.group("value")).resolve()
 
@@ -43,27 +67,98 @@ def _patch_transfer_picker_schema(output_path: Path) -> None:
     """Tighten TransferPickerControlSchema typing post generation."""
 
     try:
-        content = output_path.read_text(encoding="utf-8")
+        content = output_path.read_bytes()
     except FileNotFoundError:
         return
 
-    replacement = (
-        "class TransferPickerControlSchema(BaseTransferControlSchema, SpinnerExtraProps):\n"
-        "    type: Literal['transfer-picker'] = Field(\n"
-        "        ..., description='TransferPicker 穿梭器的弹框形态 文档：https://aisuda.bce.baidu.com/amis/zh-CN/components/form/transfer-picker'\n"
-        "    )\n"
-        "    borderMode: BorderMode | None = Field(None, description='边框模式，全边框，还是半边框，或者没边框。')\n"
-        "    pickerSize: Size | None = Field(None, description='弹窗大小')\n"
-    )
+    # Locate the generated class body with plain substring searches instead of
+    # a backtracking regex over the whole generated file.
+    start = content.find(_TPCS_START)
+    if start == -1:
+        return
+    end = content.find(_TPCS_END, start)
+    if end == -1 or b"\nclass " in content[start:end]:
+        return
+
+    output_path.write_bytes(content[:start] + _TPCS_REPLACEMENT + content[end + len(_TPCS_END) :])
+
+
+def _annotations(tree: ast.AST) -> list[ast.expr]:
+    """Collect every annotation expression in a module."""
+
+    found = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AnnAssign):
+            found.append(node.annotation)
+        elif isinstance(node, ast.arg) and node.annotation is not None:
+            found.append(node.annotation)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns is not None:
+            found.append(node.returns)
+    return found
+
+
+def _patch_schema_type_enum(output_path: Path) -> None:
+    """Replace the SchemaType enum with a Literal of component type tags."""
 
-    pattern = re.compile(
-        r"class TransferPickerControlSchema\(BaseModel\):\n(?:    .+\n)+?    pickerSize: Any \| None = None\n",
-        re.MULTILINE,
+    try:
+        content = output_path.read_bytes()
+    except FileNotFoundError:
+        return
+
+    tree = ast.parse(content)
+    enum_class = next(
+        (node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "SchemaType"),
+        None,
     )
+    if enum_class is None:
+        return
+
+    members = [
+        (node.targets[0].id, node.value.value)
+        for node in enum_class.body
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+    ]
+    if not members:
+        return
+
+    # ast offsets are UTF-8 byte columns, so edits are made on the raw bytes
+    line_starts = [0]
+    for line in content.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+
+    def span(node: ast.AST) -> tuple[int, int]:
+        return (
+            line_starts[node.lineno - 1] + node.col_offset,
+            line_starts[node.end_lineno - 1] + node.end_col_offset,
+        )
+
+    # Component type tags are validated as plain strings against a Literal;
+    # SchemaType keeps the former enum's attribute names as str constants.
+    values = "".join(f"    {value!r},\n" for _, value in members)
+    replacement = (
+        f"SchemaTypeLiteral = Literal[\n{values}]\n\n"
+        f"SCHEMA_TYPES: frozenset[str] = frozenset(\n    {{\n"
+        + "".join(f"        {value!r},\n" for _, value in members)
+        + "    }\n)\n\n\n"
+        "class SchemaType:\n"
+        + "".join(f"    {name} = {value!r}" + "\n" for name, value in members)
+    ).encode("utf-8")
+
+    # The class is bounded by its ast span, not by the next blank line
+    class_start = line_starts[enum_class.lineno - 1]
+    class_end = line_starts[enum_class.end_lineno]
+    edits = [(class_start, class_end, replacement)]
+    # Every SchemaType inside an annotation, including forward-reference strings
+    for annotation in _annotations(tree):
+        start, end = span(annotation)
+        text = content[start:end]
+        if _SCHEMA_TYPE_NAME.search(text):
+            edits.append((start, end, _SCHEMA_TYPE_NAME.sub(b"SchemaTypeLiteral", text)))
+
+    for start, end, text in sorted(edits, reverse=True):
+        content = content[:start] + text + content[end:]
+    output_path.write_bytes(content)
 
-    new_content, count = pattern.subn(replacement, content)
-    if count:
-        output_path.write_text(new_content, encoding="utf-8")
 
 def main() -> None:
     # datamodel-code-generator builds deeply nested pydantic models. Increase
@@ -77,9 +172,10 @@ def main() -> None:
     args = sys.argv[1:]
     codegen_main(args)
 
-    output_path = _extract_output_path(args)
+    output_path = _extract_output_path(tuple(args))
     if output_path is not None:
         _patch_transfer_picker_schema(output_path)
+        _patch_schema_type_enum(output_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""
+Shared schema for the AMIS Badge object.
+
+Imported by the schema fix scripts so every replaced badge field, whichever
+script replaced it, gets the same known-good definition.
+"""
+import copy
+
+# Built once at import; every replaced badge field gets its own copy
+_BADGE_TEMPLATE = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "description": "文本content",
+            "anyOf": [
+                {"type": "string"},
+                {"type": "number"},
+                {
+                    "type": "array",
+                    "items": {"type": "string"}
+                },
+                {"type": "object", "additionalProperties": True}
+            ]
+        },
+        "level": {
+            "type": "string",
+            "enum": ["success", "warning", "danger", "info", "primary"]
+        },
+        "visible": {
+            "anyOf": [
+                {"type": "boolean"},
+                {"type": "string"}
+            ]
+        },
+        "className": {
+            "anyOf": [
+                {"type": "string"},
+                {"type": "object", "additionalProperties": True}
+            ]
+        },
+        "position": {
+            "type": "string",
+            "enum": ["top-right", "top-left", "bottom-right", "bottom-left"]
+        },
+        "offset": {
+            "type": "array",
+            "items": {
+                "anyOf": [
+                    {"type": "number"},
+                    {"type": "string"}
+                ]
+            },
+            "minItems": 2,
+            "maxItems": 2
+        },
+        "size": {"type": "number"},
+        "mode": {
+            "type": "string",
+            "enum": ["text", "dot", "ribbon"]
+        },
+        "overflowCount": {"type": "number"},
+        "visibleOn": {"type": "string"},
+        "animation": {"type": "boolean"},
+        "style": {"type": "object"},
+        "styleVars": {"type": "object"}
+    },
+    "additionalProperties": True
+}
+
+
+def create_valid_badge_object():
+    """Create a valid BadgeObject schema as a fresh copy of the template."""
+    return copy.deepcopy(_BADGE_TEMPLATE)
@@ -0,0 +1,31 @@
+"""
+Shared helpers for detecting and counting Chinese (CJK) characters.
+
+Imported by the translation and cleanup scripts so the patterns are
+compiled once per process and both scripts agree on what counts as Chinese.
+"""
+import re
+
+# CJK Unified Ideographs, U+4E00..U+9FFF
+CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# UTF-8 lead bytes of U+4E00..U+9FFF; data without any of them has no Chinese
+CJK_LEAD_BYTES = (b'\xe4', b'\xe5', b'\xe6', b'\xe7', b'\xe8', b'\xe9')
+
+# Every byte except 0xE5..0xE9, whose 3-byte sequences all fall inside the range
+_NOT_CJK_FULL_LEADS = bytes(b for b in range(256) if not 0xe5 <= b <= 0xe9)
+# 0xE4 sequences are only in range from U+4E00 on, i.e. second byte 0xB8..0xBF
+_CJK_E4 = re.compile(rb'\xe4[\xb8-\xbf]')
+
+
+def contains_chinese(text: str) -> bool:
+    """Check if text contains Chinese characters."""
+    # isascii() reads a flag on the string object, so plain ASCII text skips the regex
+    return not text.isascii() and CJK_RE.search(text) is not None
+
+
+def count_chinese(text: str) -> int:
+    """Count Chinese characters without building a list of one-character matches."""
+    # bytes.translate and a sparse bytes regex both run in C over the UTF-8 data
+    data = text.encode("utf-8")
+    return len(data.translate(None, _NOT_CJK_FULL_LEADS)) + len(_CJK_E4.findall(data))
@@ -0,0 +1,48 @@
+"""
+Shared JSON helpers for the schema scripts.
+
+orjson is used when it is installed and the stdlib json module otherwise, so
+every script reads and writes schemas the same way without repeating the
+optional import and the fallback in each file.
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None
+
+
+def loads(data) -> Any:
+    """Parse JSON text or bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact unless `pretty`, without escaping non-ASCII."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_schema(path: Path) -> dict:
+    """Load JSON schema from file, parsing the raw bytes."""
+    return loads(path.read_bytes())
+
+
+def save_schema(schema: dict, path: Path, pretty: bool = False) -> None:
+    """Save JSON schema to file, compact unless `pretty`."""
+    path.write_bytes(dumps(schema, pretty=pretty))
+
+
+def parse_save_args(doc: str, argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the --pretty flag shared by the scripts that rewrite the schema."""
+    parser = argparse.ArgumentParser(description=doc.strip().splitlines()[0])
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the written schema for reading (default: compact)")
+    return parser.parse_args(argv)
@@ -14,18 +14,62 @@ Checks for:
 9. Circular references
 10. Any other code quality issues
 """
+import argparse
 import ast
+import hashlib
+import json
 import re
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 GENERATED_MODELS = Path(__file__).parent.parent / "fastapi_amis_admin" / "amis" / "auto_generated_models.py"
 
+# Collected AST facts are cached here as JSON, keyed by the sha256 of the source
+AST_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "ast"
+# Bump when the cached facts layout changes
+AST_CACHE_VERSION = 3
+
+# Sources at least this large (in characters) are analyzed in worker processes;
+# below it process startup and pickling cost more than they save
+PARALLEL_MIN_SIZE = 5_000_000
+
+# Maximum issues per category written to the report in --summary mode
+SUMMARY_LIMIT = 50
+
+# Patterns are compiled once at import time instead of inside per-line loops
+_RE_CLASS = re.compile(r'^class\s+(\w+).*?:')
+_RE_MISSING_TYPE = re.compile(r'^\s+\w+:\s*$')
+_RE_ANY_FIELD = re.compile(r'(\w+):\s+Any')
+_RE_CAMEL = re.compile(r'\b[a-z]+[A-Z][a-zA-Z]*\s*:')
+_RE_FIELD_NAME = re.compile(r'(\w+):\s+')
+_RE_ROOTMODEL = re.compile(r'class\s+(\w+)\(RootModel\[([^\]]+)\]\):', re.MULTILINE)
+_RE_ENUM = re.compile(r'^class\s+(\w+)\(Enum\):', re.MULTILINE)
+
+# typing names that must be imported when used in annotations
+COMMON_TYPES = frozenset({"Optional", "Union", "List", "Dict", "Tuple", "Literal"})
+
+# Field names that usually deserve a more specific type than Any
+COMMON_TYPED_FIELDS = frozenset({
+    "id", "name", "label", "title", "description", "type",
+    "value", "default", "required", "disabled", "hidden",
+})
+
+# Statement fields that can contain nested class definitions
+_STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
 
 def load_generated_file() -> str:
     """Load the generated models file."""
@@ -33,11 +77,127 @@ def load_generated_file() -> str:
         return f.read()
 
 
+@lru_cache(maxsize=4)
+def parse_generated(content: str) -> ast.Module:
+    """Parse the generated source once and reuse the tree for identical content."""
+    return ast.parse(content)
+
+
+@dataclass
+class ClassFacts:
+    """Facts about a single class definition."""
+    name: str
+    lineno: int
+    docstring_present: bool
+    field_counter: Counter
+    ann_field_count: int
+
+
+@dataclass
+class AstFacts:
+    """Facts collected from the generated module's statements."""
+    imported_names: Set[str] = field(default_factory=set)
+    # COMMON_TYPES names referenced in code; strings and comments are not code
+    used_typing_names: Set[str] = field(default_factory=set)
+    classes: List[ClassFacts] = field(default_factory=list)
+
+
+def collect_ast_facts(tree: ast.Module) -> AstFacts:
+    """Collect top-level imports and class fields without visiting expressions."""
+    facts = AstFacts()
+    imported_names = facts.imported_names
+    
+    for node in tree.body:
+        node_type = type(node)
+        if node_type is ast.Import:
+            for alias in node.names:
+                imported_names.add(alias.asname or alias.name.split('.')[0])
+        elif node_type is ast.ImportFrom:
+            if node.module:
+                imported_names.add(node.module.split('.')[0])
+            for alias in node.names or []:
+                imported_names.add(alias.asname or alias.name)
+    
+    # Breadth-first over statements only, in the same order as ast.walk
+    queue = deque(tree.body)
+    while queue:
+        node = queue.popleft()
+        if type(node) is ast.ClassDef:
+            field_counter = Counter()
+            ann_field_count = 0
+            for item in node.body:
+                if type(item) is ast.AnnAssign:
+                    ann_field_count += 1
+                    if type(item.target) is ast.Name:
+                        field_counter[item.target.id] += 1
+            facts.classes.append(ClassFacts(
+                name=node.name,
+                lineno=node.lineno,
+                docstring_present=bool(ast.get_docstring(node)),
+                field_counter=field_counter,
+                ann_field_count=ann_field_count,
+            ))
+        for name in _STATEMENT_FIELDS:
+            queue.extend(getattr(node, name, ()))
+    
+    facts.used_typing_names = {
+        node.id for node in ast.walk(tree)
+        if type(node) is ast.Name and node.id in COMMON_TYPES
+    }
+    
+    return facts
+
+
+def facts_cache_path(content: str, cache_dir: Path = AST_CACHE_DIR) -> Path:
+    """Return the cache file for the AST facts of the given source."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.v{AST_CACHE_VERSION}.json"
+
+
+def load_cached_facts(cache_path: Path) -> Optional[AstFacts]:
+    """Load cached AST facts, or None when there is no usable cache entry."""
+    try:
+        data = cache_path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.debug(f"Ignoring unreadable AST cache {cache_path}: {e}")
+        return None
+    try:
+        cached = orjson.loads(data) if orjson else json.loads(data)
+        return AstFacts(
+            imported_names=set(cached["imported_names"]),
+            used_typing_names=set(cached["used_typing_names"]),
+            classes=[ClassFacts(name, lineno, doc, Counter(fields), count)
+                     for name, lineno, doc, fields, count in cached["classes"]],
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        logger.debug(f"Ignoring malformed AST cache {cache_path}: {e}")
+        return None
+
+
+def store_cached_facts(cache_path: Path, facts: AstFacts) -> None:
+    """Cache AST facts as plain JSON data; nothing in the entry is executable."""
+    cached = {
+        "imported_names": sorted(facts.imported_names),
+        "used_typing_names": sorted(facts.used_typing_names),
+        "classes": [
+            [cls.name, cls.lineno, cls.docstring_present, dict(cls.field_counter), cls.ann_field_count]
+            for cls in facts.classes
+        ],
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(orjson.dumps(cached) if orjson else json.dumps(cached).encode("utf-8"))
+    except OSError as e:
+        logger.debug(f"Could not write AST cache {cache_path}: {e}")
+
+
 def analyze_syntax(content: str) -> Dict[str, Any]:
     """Check for syntax errors."""
     issues = []
     try:
-        ast.parse(content)
+        parse_generated(content)
     except SyntaxError as e:
         issues.append({
             "type": "syntax_error",
@@ -48,34 +208,15 @@ def analyze_syntax(content: str) -> Dict[str, Any]:
     return {"syntax_errors": issues}
 
 
-def analyze_imports(content: str) -> Dict[str, Any]:
+def analyze_imports(facts: Optional[AstFacts]) -> Dict[str, Any]:
     """Analyze imports for missing or unused imports."""
     issues = []
     
-    # Parse AST to get imports
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    if facts is None:
         return {"import_issues": []}
     
-    imported_names = set()
-    used_names = set()
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imported_names.add(alias.asname or alias.name.split('.')[0])
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imported_names.add(node.module.split('.')[0])
-            for alias in node.names or []:
-                imported_names.add(alias.asname or alias.name)
-        elif isinstance(node, ast.Name):
-            used_names.add(node.id)
-    
-    # Check for common missing imports
-    common_types = {"Optional", "Union", "List", "Dict", "Tuple", "Literal"}
-    missing_imports = common_types - imported_names & used_names
+    # Check for common missing imports; usage comes from Name nodes in the AST
+    missing_imports = facts.used_typing_names - facts.imported_names
     
     if missing_imports:
         issues.append({
@@ -86,28 +227,25 @@ def analyze_imports(content: str) -> Dict[str, Any]:
     return {"import_issues": issues}
 
 
-def analyze_duplicate_fields(content: str) -> Dict[str, Any]:
+def analyze_duplicate_fields(lines: List[str]) -> Dict[str, Any]:
     """Find duplicate field names in classes."""
     issues = []
-    field_counts = defaultdict(lambda: defaultdict(int))
-    
-    # Use regex to find class definitions and their fields
-    class_pattern = re.compile(r'^class\s+(\w+).*?:', re.MULTILINE)
-    field_pattern = re.compile(r'^\s+(\w+):\s+', re.MULTILINE)
+    field_counts: Dict[str, Counter] = defaultdict(Counter)
     
-    lines = content.split('\n')
     current_class = None
     
-    for i, line in enumerate(lines):
-        class_match = class_pattern.match(line)
-        if class_match:
-            current_class = class_match.group(1)
+    for line in lines:
+        if not line:
             continue
-        
-        if current_class:
-            field_match = field_pattern.match(line)
-            if field_match:
-                field_name = field_match.group(1)
+        c0 = line[0]
+        if c0 == 'c' and line.startswith('class '):
+            class_match = _RE_CLASS.match(line)
+            if class_match:
+                current_class = class_match.group(1)
+        elif current_class and c0.isspace():
+            # "name: annotation" without running a regex on every body line
+            field_name, sep, rest = line.lstrip().partition(':')
+            if sep and field_name.isidentifier() and rest[:1].isspace():
                 field_counts[current_class][field_name] += 1
     
     # Find duplicates
@@ -122,63 +260,52 @@ def analyze_duplicate_fields(content: str) -> Dict[str, Any]:
     return {"duplicate_fields": issues}
 
 
-def analyze_type_annotations(content: str) -> Dict[str, Any]:
+def analyze_type_annotations(lines: List[str]) -> Dict[str, Any]:
     """Analyze type annotations for issues."""
     issues = []
     
-    # Find type annotations
-    type_pattern = re.compile(r':\s+([^=]+?)(?:\s*=\s*|$)')
-    
-    lines = content.split('\n')
     for i, line in enumerate(lines, 1):
-        if ': ' in line and ('Field' in line or '=' in line):
-            match = type_pattern.search(line)
-            if match:
-                type_annotation = match.group(1).strip()
-                
-                # Check for invalid patterns
-                if type_annotation == "Any":
-                    # This is OK, but we can note it
-                    pass
-                elif "|" in type_annotation and "None" not in type_annotation and "Optional" not in type_annotation:
-                    # Union without None - might be missing Optional
-                    if "Field(..., " in line or "Field(" in line:
-                        # Check if it's required
-                        pass
-                
-                # Check for malformed unions
-                if type_annotation.count("|") > 5:
-                    issues.append({
-                        "type": "complex_union",
-                        "line": i,
-                        "annotation": type_annotation[:100],
-                    })
-                
-                # Check for missing spaces in unions
-                if "|" in type_annotation and " | " not in type_annotation:
-                    issues.append({
-                        "type": "malformed_union",
-                        "line": i,
-                        "annotation": type_annotation[:100],
-                    })
+        # Only union annotations can produce issues below
+        if ': ' not in line:
+            continue
+        pipe_count = line.count('|')
+        if not pipe_count or not ('Field' in line or '=' in line):
+            continue
+        
+        # The annotation runs from the first ':' up to the first '='
+        type_annotation = line.partition(':')[2].partition('=')[0].strip()
+        if "|" not in type_annotation:
+            continue
+        
+        # Check for malformed unions; the annotation cannot hold more pipes than the line
+        if pipe_count > 5 and type_annotation.count("|") > 5:
+            issues.append({
+                "type": "complex_union",
+                "line": i,
+                "annotation": type_annotation[:100],
+            })
+        
+        # Check for missing spaces in unions
+        if " | " not in type_annotation:
+            issues.append({
+                "type": "malformed_union",
+                "line": i,
+                "annotation": type_annotation[:100],
+            })
     
     return {"type_annotation_issues": issues}
 
 
-def analyze_field_definitions(content: str) -> Dict[str, Any]:
+def analyze_field_definitions(lines: List[str]) -> Dict[str, Any]:
     """Analyze field definitions for issues."""
     issues = []
     
-    # Pattern to match field definitions
-    field_pattern = re.compile(
-        r'^\s+(\w+):\s+([^=]+?)(?:\s*=\s*Field\([^)]+\))?$',
-        re.MULTILINE
-    )
-    
-    lines = content.split('\n')
     for i, line in enumerate(lines, 1):
+        if ': Any' not in line and not line.rstrip().endswith(':'):
+            continue
+        
         # Check for fields without type annotations
-        if re.match(r'^\s+\w+:\s*$', line):
+        if _RE_MISSING_TYPE.match(line):
             issues.append({
                 "type": "missing_type",
                 "line": i,
@@ -188,15 +315,11 @@ def analyze_field_definitions(content: str) -> Dict[str, Any]:
         # Check for fields with Any that might have better types
         if ': Any' in line and 'Field' in line:
             # Extract field name
-            field_match = re.search(r'(\w+):\s+Any', line)
+            field_match = _RE_ANY_FIELD.search(line)
             if field_match:
                 field_name = field_match.group(1)
                 # Check if it's a common field that should have a type
-                common_typed_fields = {
-                    "id", "name", "label", "title", "description", "type",
-                    "value", "default", "required", "disabled", "hidden",
-                }
-                if field_name.lower() in common_typed_fields:
+                if field_name.lower() in COMMON_TYPED_FIELDS:
                     issues.append({
                         "type": "any_for_common_field",
                         "line": i,
@@ -207,54 +330,45 @@ def analyze_field_definitions(content: str) -> Dict[str, Any]:
     return {"field_definition_issues": issues}
 
 
-def analyze_class_structure(content: str) -> Dict[str, Any]:
+def analyze_class_structure(facts: Optional[AstFacts]) -> Dict[str, Any]:
     """Analyze class structure for issues."""
     issues = []
     
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    if facts is None:
         return {"class_structure_issues": []}
     
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            # Check for classes without docstrings
-            if not ast.get_docstring(node):
-                issues.append({
-                    "type": "missing_docstring",
-                    "class": node.name,
-                    "line": node.lineno,
-                })
-            
-            # Check for classes with too many fields
-            field_count = sum(1 for item in node.body if isinstance(item, ast.AnnAssign))
-            if field_count > 100:
-                issues.append({
-                    "type": "too_many_fields",
-                    "class": node.name,
-                    "line": node.lineno,
-                    "field_count": field_count,
-                })
-            
-            # Check for duplicate field names in AST
-            field_names = []
-            for item in node.body:
-                if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                    field_names.append(item.target.id)
-            
-            duplicates = [name for name in field_names if field_names.count(name) > 1]
-            if duplicates:
-                issues.append({
-                    "type": "duplicate_field_names",
-                    "class": node.name,
-                    "line": node.lineno,
-                    "duplicates": list(set(duplicates)),
-                })
+    for cls in facts.classes:
+        # Check for classes without docstrings
+        if not cls.docstring_present:
+            issues.append({
+                "type": "missing_docstring",
+                "class": cls.name,
+                "line": cls.lineno,
+            })
+        
+        # Check for classes with too many fields
+        if cls.ann_field_count > 100:
+            issues.append({
+                "type": "too_many_fields",
+                "class": cls.name,
+                "line": cls.lineno,
+                "field_count": cls.ann_field_count,
+            })
+        
+        # Check for duplicate field names in AST
+        duplicates = [name for name, count in cls.field_counter.items() if count > 1]
+        if duplicates:
+            issues.append({
+                "type": "duplicate_field_names",
+                "class": cls.name,
+                "line": cls.lineno,
+                "duplicates": duplicates,
+            })
     
     return {"class_structure_issues": issues}
 
 
-def analyze_pydantic_usage(content: str) -> Dict[str, Any]:
+def analyze_pydantic_usage(content: str, lines: List[str]) -> Dict[str, Any]:
     """Analyze Pydantic-specific issues."""
     issues = []
     
@@ -278,39 +392,43 @@ def analyze_pydantic_usage(content: str) -> Dict[str, Any]:
             "message": "Using old Config class instead of ConfigDict",
         })
     
+    # Check for Field without proper import; the header does not change per line
+    pydantic_imported = "from pydantic import" in content[:1000]
+    
     # Check for Field usage
-    lines = content.split('\n')
     for i, line in enumerate(lines, 1):
-        # Check for Field without proper import
-        if "Field(" in line and "from pydantic import" not in content[:1000]:
+        if "Field(" not in line:
+            continue
+        
+        if not pydantic_imported:
             # This is OK if import is at top
             pass
         
         # Check for Field with invalid arguments
-        if "Field(" in line:
-            # Check for common issues
-            if "alias=" in line and '"' not in line and "'" not in line:
-                issues.append({
-                    "type": "invalid_field_alias",
-                    "line": i,
-                    "content": line.strip()[:100],
-                })
+        if "alias=" in line and '"' not in line and "'" not in line:
+            issues.append({
+                "type": "invalid_field_alias",
+                "line": i,
+                "content": line.strip()[:100],
+            })
     
     return {"pydantic_issues": issues}
 
 
-def analyze_naming_conventions(content: str) -> Dict[str, Any]:
+def analyze_naming_conventions(lines: List[str]) -> Dict[str, Any]:
     """Check naming conventions."""
     issues = []
     
     # Check for inconsistent naming
-    lines = content.split('\n')
     for i, line in enumerate(lines, 1):
+        if 'Field(' not in line:
+            continue
+        
         # Check for camelCase in Python (should be snake_case)
-        if re.search(r'\b[a-z]+[A-Z][a-zA-Z]*\s*:', line) and 'Field(' in line:
+        if _RE_CAMEL.search(line):
             # This might be OK if it's an alias
             if 'alias=' not in line:
-                match = re.search(r'(\w+):\s+', line)
+                match = _RE_FIELD_NAME.search(line)
                 if match:
                     field_name = match.group(1)
                     if any(c.isupper() for c in field_name[1:]):
@@ -324,7 +442,7 @@ def analyze_naming_conventions(content: str) -> Dict[str, Any]:
     return {"naming_issues": issues}
 
 
-def analyze_enum_usage(content: str) -> Dict[str, Any]:
+def analyze_enum_usage(content: str, lines: List[str]) -> Dict[str, Any]:
     """Analyze Enum usage."""
     issues = []
     
@@ -334,17 +452,12 @@ def analyze_enum_usage(content: str) -> Dict[str, Any]:
             "type": "missing_enum_import",
         })
     
-    # Check for Enum definitions
-    enum_pattern = re.compile(r'^class\s+(\w+)\(Enum\):', re.MULTILINE)
-    enums = enum_pattern.findall(content)
-    
     # Check for enums with single value
-    lines = content.split('\n')
     current_enum = None
     enum_values = []
     
     for i, line in enumerate(lines):
-        enum_match = enum_pattern.match(line)
+        enum_match = _RE_ENUM.match(line)
         if enum_match:
             if current_enum and len(enum_values) == 1:
                 issues.append({
@@ -365,8 +478,7 @@ def analyze_root_models(content: str) -> Dict[str, Any]:
     issues = []
     
     # Check for RootModel usage
-    root_model_pattern = re.compile(r'class\s+(\w+)\(RootModel\[([^\]]+)\]\):', re.MULTILINE)
-    root_models = root_model_pattern.findall(content)
+    root_models = _RE_ROOTMODEL.findall(content)
     
     for class_name, root_type in root_models:
         # Check if root type is Any
@@ -381,48 +493,74 @@ def analyze_root_models(content: str) -> Dict[str, Any]:
     return {"rootmodel_issues": issues}
 
 
-def main() -> int:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze generated models for issues.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--full", dest="summary", action="store_false",
+                      help="write every issue to the report (default)")
+    mode.add_argument("--summary", dest="summary", action="store_true",
+                      help=f"write at most {SUMMARY_LIMIT} issues per category as compact JSON")
+    parser.set_defaults(summary=False)
+    parser.add_argument("--cache-dir", type=Path, default=AST_CACHE_DIR,
+                        help=f"directory for cached AST facts (default: {AST_CACHE_DIR})")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main analysis function."""
+    args = parse_args(argv)
+    
     logger.info("=" * 80)
     logger.info("DEEP ANALYSIS: Generated Models Issues")
     logger.info("=" * 80)
     
     logger.info("Loading generated file...")
     content = load_generated_file()
+    lines = content.split('\n')
     
-    logger.info("Analyzing...")
     all_issues = {}
     
     # Run all analyses
-    logger.info("1. Checking syntax...")
-    all_issues.update(analyze_syntax(content))
-    
-    logger.info("2. Analyzing imports...")
-    all_issues.update(analyze_imports(content))
-    
-    logger.info("3. Checking for duplicate fields...")
-    all_issues.update(analyze_duplicate_fields(content))
-    
-    logger.info("4. Analyzing type annotations...")
-    all_issues.update(analyze_type_annotations(content))
-    
-    logger.info("5. Analyzing field definitions...")
-    all_issues.update(analyze_field_definitions(content))
-    
-    logger.info("6. Analyzing class structure...")
-    all_issues.update(analyze_class_structure(content))
-    
-    logger.info("7. Analyzing Pydantic usage...")
-    all_issues.update(analyze_pydantic_usage(content))
-    
-    logger.info("8. Checking naming conventions...")
-    all_issues.update(analyze_naming_conventions(content))
-    
-    logger.info("9. Analyzing Enum usage...")
-    all_issues.update(analyze_enum_usage(content))
-    
-    logger.info("10. Analyzing RootModel usage...")
-    all_issues.update(analyze_root_models(content))
+    logger.info(
+        "Running analyses: syntax, imports, duplicate fields, type annotations, "
+        "field definitions, class structure, Pydantic usage, naming conventions, "
+        "Enum usage, RootModel usage..."
+    )
+    # Only sources that parsed are cached, so a cache hit also means no syntax errors
+    cache_path = facts_cache_path(content, args.cache_dir)
+    facts = load_cached_facts(cache_path)
+    if facts is not None:
+        all_issues["syntax_errors"] = []
+    else:
+        all_issues.update(analyze_syntax(content))
+        if not all_issues["syntax_errors"]:
+            # The tree is parsed once; AST-based analyzers share the collected facts
+            facts = collect_ast_facts(parse_generated(content))
+            store_cached_facts(cache_path, facts)
+    
+    # The remaining analyzers are independent of each other
+    analyses = [
+        (analyze_imports, (facts,)),
+        (analyze_duplicate_fields, (lines,)),
+        (analyze_type_annotations, (lines,)),
+        (analyze_field_definitions, (lines,)),
+        (analyze_class_structure, (facts,)),
+        (analyze_pydantic_usage, (content, lines)),
+        (analyze_naming_conventions, (lines,)),
+        (analyze_enum_usage, (content, lines)),
+        (analyze_root_models, (content,)),
+    ]
+    
+    if len(content) >= PARALLEL_MIN_SIZE:
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(analyzer, *analyzer_args) for analyzer, analyzer_args in analyses]
+            # Results are merged in submission order to keep the report stable
+            for future in futures:
+                all_issues.update(future.result())
+    else:
+        for analyzer, analyzer_args in analyses:
+            all_issues.update(analyzer(*analyzer_args))
     
     # Print report
     print("\n" + "=" * 80)
@@ -450,10 +588,20 @@ def main() -> int:
                 print(f"  - {issues}")
     
     # Save detailed report
-    import json
     report_path = Path(__file__).parent.parent / "generated_models_analysis_report.json"
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(all_issues, f, indent=2, ensure_ascii=False, default=str)
+    report = all_issues
+    if args.summary:
+        report = {key: value[:SUMMARY_LIMIT] for key, value in all_issues.items()}
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS if args.summary else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        report_path.write_bytes(orjson.dumps(report, default=str, option=option))
+    else:
+        import json
+        with open(report_path, "w", encoding="utf-8") as f:
+            if args.summary:
+                json.dump(report, f, ensure_ascii=False, default=str, separators=(",", ":"))
+            else:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
     
     logger.info(f"\nDetailed report saved to: {report_path}")
     
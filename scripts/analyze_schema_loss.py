@@ -11,11 +11,13 @@ This script compares the original schema with the simplified schema to identify:
 6. Lost examples
 7. Truncated anyOf/oneOf/allOf unions
 """
-import json
+import argparse
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from _json_utils import loads
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -23,155 +25,176 @@ logger = logging.getLogger(__name__)
 ORIGINAL_SCHEMA = Path(__file__).parent.parent / "schema" / "schema_translated.json"
 SIMPLIFIED_SCHEMA = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
+# Maximum issues per category written to the report in --summary mode
+SUMMARY_LIMIT = 50
+
+
+# Issues are recorded as tuples and only formatted when reported
+ISSUE_FORMATTERS: Dict[str, Callable[..., str]] = {
+    "value_changes": lambda path, orig, simp: f"{path}: Value changed from {orig} to {simp}",
+    "missing_keys": lambda path, keys: f"{path}: Missing keys {keys}",
+    "lost_descriptions": lambda path: f"{path}: Lost description",
+    "modified_descriptions": lambda path: f"{path}: Description modified",
+    "lost_examples": lambda path: f"{path}: Lost examples",
+    "lost_enums": lambda path, enum: f"{path}: Lost enum {enum}",
+    "modified_enums": lambda path, orig, simp: f"{path}: Enum changed from {orig} to {simp}",
+    "lost_constraints": lambda path, key, value: f"{path}: Lost {key}={value}",
+    "lost_defaults": lambda path, value: f"{path}: Lost default={value}",
+    "truncated_unions": lambda path, key, orig, simp: f"{path}: {key} truncated from {orig} to {simp} items",
+    "lost_unions": lambda path, key, count: f"{path}: Lost {key} with {count} items",
+    "missing_properties": lambda path, props=None: (
+        f"{path}.properties: Missing {props}" if props else f"{path}: All properties lost"
+    ),
+    "lost_items": lambda path: f"{path}: Lost items schema",
+    "modified_additional_properties": lambda path: f"{path}: additionalProperties changed",
+    "key_reductions": lambda key, orig, simp, lost: f"{key}: {orig} -> {simp} (lost {lost})",
+}
+
+
+def format_issue(issue_type: str, issue: Any) -> str:
+    """Format a recorded issue for display."""
+    formatter = ISSUE_FORMATTERS.get(issue_type)
+    return formatter(*issue) if formatter else str(issue)
+
 
 def load_schema(path: Path) -> Dict[str, Any]:
-    """Load JSON schema."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load JSON schema, parsing the raw bytes."""
+    return loads(path.read_bytes())
 
 
-def count_keys(obj: Any, key_counts: Dict[str, int], path: str = "") -> None:
-    """Recursively count all keys in schema."""
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            key_counts[key] = key_counts.get(key, 0) + 1
-            count_keys(value, key_counts, f"{path}.{key}" if path else key)
-    elif isinstance(obj, list):
-        for item in obj:
-            count_keys(item, key_counts, path)
+def count_keys(root: Any, key_counts: Counter) -> None:
+    """Count all keys in schema using an explicit stack instead of recursion."""
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        # Parsed JSON only yields exact dict/list containers, so type() is enough
+        obj_type = type(obj)
+        if obj_type is dict:
+            for key, value in obj.items():
+                key_counts[key] += 1
+                value_type = type(value)
+                if value_type is dict or value_type is list:
+                    stack.append(value)
+        elif obj_type is list:
+            stack.extend(item for item in obj if type(item) is dict or type(item) is list)
 
 
 def analyze_definition(
     def_name: str,
     original: Any,
     simplified: Any,
-    issues: Dict[str, List[str]],
+    issues: Dict[str, List[Any]],
 ) -> None:
-    """Analyze a single definition for lost information."""
-    path_prefix = f"definitions.{def_name}"
-    
-    # Handle non-dict values
-    if not isinstance(original, dict) or not isinstance(simplified, dict):
-        if original != simplified:
-            issues["value_changes"].append(
-                f"{path_prefix}: Value changed from {type(original).__name__} to {type(simplified).__name__}"
-            )
-        return
-    
-    # Check for missing keys
-    orig_keys = set(original.keys())
-    simp_keys = set(simplified.keys())
-    missing_keys = orig_keys - simp_keys
-    
-    if missing_keys:
-        issues["missing_keys"].append(
-            f"{path_prefix}: Missing keys {missing_keys}"
-        )
-    
-    # Check for lost descriptions
-    if "description" in original and "description" not in simplified:
-        issues["lost_descriptions"].append(f"{path_prefix}: Lost description")
-    elif "description" in original and "description" in simplified:
-        if original["description"] != simplified["description"]:
-            issues["modified_descriptions"].append(f"{path_prefix}: Description modified")
-    
-    # Check for lost examples
-    if "examples" in original and "examples" not in simplified:
-        issues["lost_examples"].append(f"{path_prefix}: Lost examples")
-    
-    # Check for lost enum
-    if "enum" in original and "enum" not in simplified:
-        issues["lost_enums"].append(f"{path_prefix}: Lost enum {original['enum']}")
-    elif "enum" in original and "enum" in simplified:
-        orig_enum = set(original["enum"])
-        simp_enum = set(simplified["enum"])
-        if orig_enum != simp_enum:
-            issues["modified_enums"].append(
-                f"{path_prefix}: Enum changed from {orig_enum} to {simp_enum}"
-            )
-    
-    # Check for lost constraints
-    constraint_keys = ["minimum", "maximum", "minLength", "maxLength", "pattern", "format"]
-    for key in constraint_keys:
-        if key in original and key not in simplified:
-            issues["lost_constraints"].append(f"{path_prefix}: Lost {key}={original[key]}")
-    
-    # Check for lost default values
-    if "default" in original and "default" not in simplified:
-        issues["lost_defaults"].append(f"{path_prefix}: Lost default={original['default']}")
-    
-    # Check for truncated anyOf/oneOf/allOf
-    for union_key in ["anyOf", "oneOf", "allOf"]:
-        if union_key in original:
-            orig_items = len(original[union_key]) if isinstance(original[union_key], list) else 0
-            if union_key in simplified:
-                simp_items = len(simplified[union_key]) if isinstance(simplified[union_key], list) else 0
-                if simp_items < orig_items:
-                    issues["truncated_unions"].append(
-                        f"{path_prefix}: {union_key} truncated from {orig_items} to {simp_items} items"
-                    )
-            else:
-                issues["lost_unions"].append(
-                    f"{path_prefix}: Lost {union_key} with {orig_items} items"
-                )
-    
-    # Recursively check properties
-    if "properties" in original:
-        orig_props = original["properties"]
-        if "properties" in simplified:
-            simp_props = simplified["properties"]
-            
-            # Check for missing properties
-            missing_props = set(orig_props.keys()) - set(simp_props.keys())
-            if missing_props:
-                issues["missing_properties"].append(
-                    f"{path_prefix}.properties: Missing {missing_props}"
-                )
-            
-            # Recursively check each property
-            for prop_name in orig_props.keys() & simp_props.keys():
-                analyze_definition(
-                    f"{def_name}.properties.{prop_name}",
-                    orig_props[prop_name],
-                    simp_props[prop_name],
-                    issues,
-                )
-        else:
-            issues["missing_properties"].append(
-                f"{path_prefix}: All properties lost"
-            )
-    
-    # Check items (for arrays)
-    if "items" in original:
-        if "items" not in simplified:
-            issues["lost_items"].append(f"{path_prefix}: Lost items schema")
-        else:
-            analyze_definition(
-                f"{def_name}.items",
-                original["items"],
-                simplified["items"],
-                issues,
-            )
-    
-    # Check additionalProperties
-    if "additionalProperties" in original:
-        orig_ap = original["additionalProperties"]
-        if "additionalProperties" in simplified:
-            simp_ap = simplified["additionalProperties"]
-            if isinstance(orig_ap, dict) and isinstance(simp_ap, dict):
-                analyze_definition(
-                    f"{def_name}.additionalProperties",
-                    orig_ap,
-                    simp_ap,
-                    issues,
-                )
-            elif orig_ap != simp_ap:
-                issues["modified_additional_properties"].append(
-                    f"{path_prefix}: additionalProperties changed"
+    """Analyze a single definition for lost information.
+    
+    Nested properties, items and additionalProperties are visited from an
+    explicit stack in the same depth-first order as a recursive walk.
+    """
+    stack = [(f"definitions.{def_name}", original, simplified)]
+    while stack:
+        path_prefix, original, simplified = stack.pop()
+        
+        # Handle non-dict values
+        if type(original) is not dict or type(simplified) is not dict:
+            if original != simplified:
+                issues["value_changes"].append(
+                    (path_prefix, type(original).__name__, type(simplified).__name__)
                 )
+            continue
+        
+        # Check for missing keys
+        missing_keys = original.keys() - simplified.keys()
+        
+        if missing_keys:
+            issues["missing_keys"].append((path_prefix, missing_keys))
+        
+        # Check for lost descriptions
+        if "description" in original and "description" not in simplified:
+            issues["lost_descriptions"].append((path_prefix,))
+        elif "description" in original and "description" in simplified:
+            if original["description"] != simplified["description"]:
+                issues["modified_descriptions"].append((path_prefix,))
+        
+        # Check for lost examples
+        if "examples" in original and "examples" not in simplified:
+            issues["lost_examples"].append((path_prefix,))
+        
+        # Check for lost enum
+        if "enum" in original and "enum" not in simplified:
+            issues["lost_enums"].append((path_prefix, original["enum"]))
+        elif "enum" in original and "enum" in simplified:
+            orig_enum = set(original["enum"])
+            simp_enum = set(simplified["enum"])
+            if orig_enum != simp_enum:
+                issues["modified_enums"].append((path_prefix, orig_enum, simp_enum))
+        
+        # Check for lost constraints
+        constraint_keys = ["minimum", "maximum", "minLength", "maxLength", "pattern", "format"]
+        for key in constraint_keys:
+            if key in original and key not in simplified:
+                issues["lost_constraints"].append((path_prefix, key, original[key]))
+        
+        # Check for lost default values
+        if "default" in original and "default" not in simplified:
+            issues["lost_defaults"].append((path_prefix, original["default"]))
+        
+        # Check for truncated anyOf/oneOf/allOf
+        for union_key in ["anyOf", "oneOf", "allOf"]:
+            if union_key in original:
+                orig_items = len(original[union_key]) if type(original[union_key]) is list else 0
+                if union_key in simplified:
+                    simp_items = len(simplified[union_key]) if type(simplified[union_key]) is list else 0
+                    if simp_items < orig_items:
+                        issues["truncated_unions"].append(
+                            (path_prefix, union_key, orig_items, simp_items)
+                        )
+                else:
+                    issues["lost_unions"].append((path_prefix, union_key, orig_items))
+        
+        # Children are collected in visit order and pushed reversed
+        children = []
+        
+        # Check each property
+        if "properties" in original:
+            orig_props = original["properties"]
+            if "properties" in simplified:
+                simp_props = simplified["properties"]
+                
+                # Check for missing properties
+                missing_props = orig_props.keys() - simp_props.keys()
+                if missing_props:
+                    issues["missing_properties"].append((path_prefix, missing_props))
+                
+                for prop_name in orig_props.keys() & simp_props.keys():
+                    children.append((
+                        f"{path_prefix}.properties.{prop_name}",
+                        orig_props[prop_name],
+                        simp_props[prop_name],
+                    ))
+            else:
+                issues["missing_properties"].append((path_prefix,))
+        
+        # Check items (for arrays)
+        if "items" in original:
+            if "items" not in simplified:
+                issues["lost_items"].append((path_prefix,))
+            else:
+                children.append((f"{path_prefix}.items", original["items"], simplified["items"]))
+        
+        # Check additionalProperties
+        if "additionalProperties" in original:
+            orig_ap = original["additionalProperties"]
+            if "additionalProperties" in simplified:
+                simp_ap = simplified["additionalProperties"]
+                if type(orig_ap) is dict and type(simp_ap) is dict:
+                    children.append((f"{path_prefix}.additionalProperties", orig_ap, simp_ap))
+                elif orig_ap != simp_ap:
+                    issues["modified_additional_properties"].append((path_prefix,))
+        
+        stack.extend(reversed(children))
 
 
-def analyze_schemas() -> Dict[str, List[str]]:
+def analyze_schemas() -> Dict[str, List[Any]]:
     """Compare original and simplified schemas."""
     logger.info("Loading schemas...")
     original = load_schema(ORIGINAL_SCHEMA)
@@ -184,12 +207,12 @@ def analyze_schemas() -> Dict[str, List[str]]:
     logger.info(f"Simplified definitions: {len(simp_defs)}")
     
     # Check for missing definitions
-    missing_defs = set(orig_defs.keys()) - set(simp_defs.keys())
+    missing_defs = orig_defs.keys() - simp_defs.keys()
     if missing_defs:
         logger.warning(f"Missing definitions: {len(missing_defs)}")
     
     # Initialize issues tracker
-    issues: Dict[str, List[str]] = defaultdict(list)
+    issues: Dict[str, List[Any]] = defaultdict(list)
     
     if missing_defs:
         issues["missing_definitions"] = list(missing_defs)
@@ -205,8 +228,8 @@ def analyze_schemas() -> Dict[str, List[str]]:
         )
     
     # Count keys in both schemas
-    orig_key_counts: Dict[str, int] = {}
-    simp_key_counts: Dict[str, int] = {}
+    orig_key_counts: Counter = Counter()
+    simp_key_counts: Counter = Counter()
     count_keys(original, orig_key_counts)
     count_keys(simplified, simp_key_counts)
     
@@ -214,13 +237,13 @@ def analyze_schemas() -> Dict[str, List[str]]:
     key_reduction = {}
     for key in orig_key_counts:
         orig_count = orig_key_counts[key]
-        simp_count = simp_key_counts.get(key, 0)
+        simp_count = simp_key_counts[key]
         if simp_count < orig_count:
             key_reduction[key] = (orig_count, simp_count, orig_count - simp_count)
     
     if key_reduction:
         issues["key_reductions"] = [
-            f"{key}: {orig} -> {simp} (lost {lost})"
+            (key, orig, simp, lost)
             for key, (orig, simp, lost) in sorted(
                 key_reduction.items(), key=lambda x: x[1][2], reverse=True
             )[:20]  # Top 20
@@ -229,7 +252,7 @@ def analyze_schemas() -> Dict[str, List[str]]:
     return dict(issues)
 
 
-def print_report(issues: Dict[str, List[str]]) -> None:
+def print_report(issues: Dict[str, List[Any]]) -> None:
     """Print analysis report."""
     print("\n" + "=" * 80)
     print("SCHEMA SIMPLIFICATION ANALYSIS REPORT")
@@ -257,7 +280,9 @@ def print_report(issues: Dict[str, List[str]]) -> None:
         "key_reductions",
     ]
     
+    printed = set()
     for issue_type in priority_order:
+        printed.add(issue_type)
         if issue_type in issues and issues[issue_type]:
             count = len(issues[issue_type])
             print(f"\n{issue_type.upper().replace('_', ' ')}: {count}")
@@ -265,26 +290,40 @@ def print_report(issues: Dict[str, List[str]]) -> None:
             
             # Show first 10 examples
             for issue in issues[issue_type][:10]:
-                print(f"  - {issue}")
+                print(f"  - {format_issue(issue_type, issue)}")
             
             if count > 10:
                 print(f"  ... and {count - 10} more")
     
     # Show any other issues
     for issue_type, issue_list in issues.items():
-        if issue_type not in priority_order and issue_list:
+        if issue_type not in printed and issue_list:
             print(f"\n{issue_type.upper().replace('_', ' ')}: {len(issue_list)}")
             print("-" * 80)
             for issue in issue_list[:5]:
-                print(f"  - {issue}")
+                print(f"  - {format_issue(issue_type, issue)}")
             if len(issue_list) > 5:
                 print(f"  ... and {len(issue_list) - 5} more")
     
     print("\n" + "=" * 80)
 
 
-def main() -> int:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze information lost by schema simplification.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--full", dest="summary", action="store_false",
+                      help="write every issue to the report (default)")
+    mode.add_argument("--summary", dest="summary", action="store_true",
+                      help=f"write at most {SUMMARY_LIMIT} issues per category")
+    parser.set_defaults(summary=False)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function."""
+    args = parse_args(argv)
+    
     if not ORIGINAL_SCHEMA.exists():
         logger.error(f"Original schema not found: {ORIGINAL_SCHEMA}")
         return 1
@@ -305,8 +344,9 @@ def main() -> int:
             if issue_list:
                 f.write(f"\n{issue_type.upper().replace('_', ' ')}: {len(issue_list)}\n")
                 f.write("-" * 80 + "\n")
-                for issue in issue_list:
-                    f.write(f"  • {issue}\n")
+                if args.summary:
+                    issue_list = issue_list[:SUMMARY_LIMIT]
+                f.writelines(f"  • {format_issue(issue_type, issue)}\n" for issue in issue_list)
     
     logger.info(f"\nFull report saved to: {report_path}")
     
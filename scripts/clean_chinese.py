@@ -9,15 +9,27 @@ import logging
 import re
 from pathlib import Path
 
+from _cjk_utils import CJK_LEAD_BYTES, CJK_RE, contains_chinese, count_chinese
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 MODELS_PATH = Path(__file__).parent.parent / "fastapi_amis_admin" / "amis" / "auto_generated_models.py"
 
-
-def contains_chinese(text: str) -> bool:
-    """Check if text contains Chinese characters."""
-    return bool(re.search(r'[\u4e00-\u9fff]', text))
+# Compiled once at import time; the helpers below run them on every line
+# A class header, an optional blank line (always dropped), then either a
+# docstring up to its closing delimiter or a run of unquoted Chinese lines
+_CLASS_DOCSTRING = re.compile(
+    r'^(?P<header>class[^\S\n]+(?P<name>\w+)\([^)\n]+\):[^\n]*)'
+    r'(?:\n[^\S\n]*(?=\n|\Z))?'
+    r'(?:(?P<docstring>\n[^\n]*?(?P<quote>"""|\'\'\').*?(?P=quote)[^\n]*)'
+    r'|(?P<malformed>\n(?![^\n]*(?:"""|\'\'\'))[^\n]*[\u4e00-\u9fff][^\n]*'
+    r'(?:\n(?!class\s)(?![^\n]*(?:"""|\'\'\'))[^\n]*[\u4e00-\u9fff][^\n]*)*))?',
+    re.MULTILINE | re.DOTALL,
+)
+# A description= value that itself contains Chinese, matched in one scan
+_DESC_CJK = re.compile(r"description=['\"]([^'\"]*[\u4e00-\u9fff][^'\"]*)['\"]")
+_LEAD_CJK = re.compile(r'^\s+[\u4e00-\u9fff]')
 
 
 def remove_chinese_from_docstrings(content: str) -> str:
@@ -30,52 +42,93 @@ def remove_chinese_from_docstrings(content: str) -> str:
     Returns:
         Content with Chinese removed/replaced
     """
+    # Lines without Chinese are never changed, so a clean input is returned as is
+    if not CJK_RE.search(content):
+        return content
+    
     lines = content.split('\n')
     result = []
     in_docstring = False
     docstring_delimiter = None
+    # Checked once so skipped lines are not sliced for messages nobody sees
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for line in lines:
-        # Detect docstring start/end
-        if '"""' in line or "'''" in line:
-            delimiter = '"""' if '"""' in line else "'''"
-            if not in_docstring:
-                in_docstring = True
-                docstring_delimiter = delimiter
-            elif docstring_delimiter == delimiter:
-                in_docstring = False
-                docstring_delimiter = None
+        has_chinese = contains_chinese(line)
+        # Substring tests are much cheaper than counting, so most lines are
+        # classified without calling str.count at all
+        has_quotes = '"""' in line or "'''" in line
         
-        # Remove Chinese from docstrings
-        if in_docstring and contains_chinese(line):
-            # Remove lines with Chinese in docstrings
-            logger.debug(f"Removing Chinese docstring line: {line[:80]}...")
+        # Lines without Chinese or docstring quotes never change
+        if not has_chinese and not has_quotes:
+            result.append(line)
             continue
         
-        # Fix malformed docstrings (Chinese text without proper quotes)
-        if contains_chinese(line) and not in_docstring:
-            # Check if this is a malformed docstring line
-            if re.match(r'^\s+[\u4e00-\u9fff]', line):
+        # Detect docstring start/end: an odd number of delimiters toggles the
+        # state, so single-line docstrings like """foo""" leave it unchanged
+        if has_quotes:
+            double_count = line.count('"""')
+            single_count = line.count("'''")
+            if in_docstring:
+                if (double_count if docstring_delimiter == '"""' else single_count) % 2:
+                    in_docstring = False
+                    docstring_delimiter = None
+            elif double_count % 2:
+                in_docstring = True
+                docstring_delimiter = '"""'
+            elif single_count % 2:
+                in_docstring = True
+                docstring_delimiter = "'''"
+        
+        if has_chinese:
+            # Remove Chinese from docstrings
+            if in_docstring:
+                # Remove lines with Chinese in docstrings
+                if debug:
+                    logger.debug("Removing Chinese docstring line: %s...", line[:80])
+                continue
+            
+            # Fix malformed docstrings (Chinese text without proper quotes)
+            if _LEAD_CJK.match(line):
                 # This is Chinese text that should be in a docstring but isn't
-                logger.debug(f"Removing malformed Chinese line: {line[:80]}...")
+                if debug:
+                    logger.debug("Removing malformed Chinese line: %s...", line[:80])
                 continue
-        
-        # Replace Chinese in description fields
-        if 'description=' in line and contains_chinese(line):
-            # Extract the description value - handle both single and double quotes
-            match = re.search(r"description=['\"]([^'\"]+)['\"]", line)
+            
+            # Replace Chinese in description fields - handle both single and double quotes
+            match = _DESC_CJK.search(line)
             if match:
                 chinese_desc = match.group(1)
-                # Replace with generic description
+                # Replace with generic description, splicing at the match position
                 english_desc = "Component property"
-                line = line.replace(chinese_desc, english_desc)
-                logger.debug(f"Replaced Chinese description: {chinese_desc[:50]}... -> {english_desc}")
+                line = line[:match.start(1)] + english_desc + line[match.end(1):]
+                if debug:
+                    logger.debug("Replaced Chinese description: %s... -> %s", chinese_desc[:50], english_desc)
         
         result.append(line)
     
     return '\n'.join(result)
 
 
+def _replace_class_docstring(match: re.Match) -> str:
+    """Rewrite one class header match from ``_CLASS_DOCSTRING``."""
+    header = match.group('header')
+    class_name = match.group('name')
+    
+    if match.group('malformed') is not None:
+        # Chinese text right after the class header without docstring quotes
+        logger.debug("Removing malformed Chinese lines after %s", class_name)
+        return header
+    
+    docstring = match.group('docstring')
+    if docstring is None:
+        return header
+    if contains_chinese(docstring):
+        logger.debug("Replaced Chinese docstring for %s", class_name)
+        return f'{header}\n    """\n    AMIS {class_name} component.\n    """'
+    return header + docstring
+
+
 def remove_chinese_docstring_classes(content: str) -> str:
     """
     Remove entire docstrings that contain Chinese and fix malformed docstrings.
@@ -86,76 +139,7 @@ def remove_chinese_docstring_classes(content: str) -> str:
     Returns:
         Content with Chinese docstrings removed
     """
-    lines = content.split('\n')
-    result = []
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check if this is a class definition
-        class_match = re.match(r'^class\s+(\w+)\([^)]+\):', line)
-        if class_match:
-            class_name = class_match.group(1)
-            result.append(line)
-            i += 1
-            
-            # Check next lines for docstring
-            if i < len(lines) and lines[i].strip() == '':
-                i += 1
-            
-            # Check if next line starts a docstring
-            if i < len(lines):
-                next_line = lines[i]
-                # Check for malformed docstring (Chinese text without quotes)
-                if contains_chinese(next_line) and '"""' not in next_line and "'''" not in next_line:
-                    # Skip this malformed line
-                    logger.debug(f"Removing malformed Chinese line after {class_name}: {next_line[:80]}...")
-                    i += 1
-                    # Skip until we find closing quotes or next class
-                    while i < len(lines):
-                        if '"""' in lines[i] or "'''" in lines[i] or re.match(r'^class\s+', lines[i]):
-                            break
-                        if contains_chinese(lines[i]):
-                            i += 1
-                            continue
-                        break
-                    continue
-                
-                # Check for proper docstring
-                if '"""' in next_line or "'''" in next_line:
-                    # This is a docstring - check if it contains Chinese
-                    docstring_lines = [next_line]
-                    i += 1
-                    in_docstring = True
-                    delimiter = '"""' if '"""' in next_line else "'''"
-                    
-                    # Collect docstring lines
-                    while i < len(lines) and in_docstring:
-                        docstring_lines.append(lines[i])
-                        if delimiter in lines[i] and lines[i].count(delimiter) >= 2:
-                            in_docstring = False
-                        i += 1
-                    
-                    # Check if docstring contains Chinese
-                    docstring_content = '\n'.join(docstring_lines)
-                    if contains_chinese(docstring_content):
-                        # Replace with generic docstring
-                        result.append(f'    """')
-                        result.append(f'    AMIS {class_name} component.')
-                        result.append(f'    """')
-                        logger.debug(f"Replaced Chinese docstring for {class_name}")
-                    else:
-                        # Keep original docstring
-                        result.extend(docstring_lines)
-                    continue
-            
-            continue
-        
-        result.append(line)
-        i += 1
-    
-    return '\n'.join(result)
+    return _CLASS_DOCSTRING.sub(_replace_class_docstring, content)
 
 
 def main():
@@ -166,13 +150,25 @@ def main():
     
     # Read file
     logger.info(f"Reading {MODELS_PATH}")
-    with open(MODELS_PATH, "r", encoding="utf-8") as f:
-        content = f.read()
+    raw = MODELS_PATH.read_bytes()
+    
+    # Already-cleaned files are the common case; checking the raw bytes for
+    # CJK lead bytes skips decoding and both passes
+    if not any(lead in raw for lead in CJK_LEAD_BYTES):
+        logger.info("No Chinese characters found, skipping")
+        return 0
+    content = raw.decode("utf-8")
+    del raw
+    if "\r" in content:
+        # Same newline translation read_text() applies
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
     
     # Count Chinese before
-    chinese_before = len(re.findall(r'[\u4e00-\u9fff]', content))
+    chinese_before = count_chinese(content)
     logger.info(f"Chinese characters before: {chinese_before}")
     
+    # Each pass rebinds content, so only the current input and output copies
+    # of the file are alive at any time
     # Remove Chinese from class docstrings
     content = remove_chinese_docstring_classes(content)
     
@@ -180,12 +176,11 @@ def main():
     content = remove_chinese_from_docstrings(content)
     
     # Count Chinese after
-    chinese_after = len(re.findall(r'[\u4e00-\u9fff]', content))
+    chinese_after = count_chinese(content)
     
     # Write back
     logger.info(f"Writing cleaned content to {MODELS_PATH}")
-    with open(MODELS_PATH, "w", encoding="utf-8") as f:
-        f.write(content)
+    MODELS_PATH.write_text(content, encoding="utf-8")
     
     logger.info("=" * 60)
     logger.info(f"✅ Post-processing complete!")
@@ -5,26 +5,68 @@ Comprehensive fix for badge validation issues in the simplified schema.
 This script specifically targets the TplSchema and fixes all nested
 badge field definitions that are causing validation errors.
 """
-import json
 import logging
+import pickle
 from pathlib import Path
 
+from _json_utils import dumps, loads, save_schema
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
+# Proper BadgeObject structure that replaces broken badge definitions
+BADGE_OBJECT = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "anyOf": [
+                {"type": "string"},
+                {"type": "array", "items": {"type": "string"}},
+                {"type": "object", "additionalProperties": True}
+            ]
+        },
+        "level": {
+            "type": "string",
+            "enum": ["success", "warning", "danger", "info", "primary"]
+        },
+        "visible": {
+            "anyOf": [
+                {"type": "boolean"},
+                {"type": "string"}
+            ]
+        },
+        "className": {
+            "anyOf": [
+                {"type": "string"},
+                {"type": "object", "additionalProperties": True}
+            ]
+        },
+        "position": {
+            "type": "string",
+            "enum": ["top-right", "top-left", "bottom-right", "bottom-left"]
+        },
+        "offset": {
+            "anyOf": [
+                {"type": "array", "items": {"type": ["number", "string"]}},
+                {"type": "object", "additionalProperties": True},
+                {"type": "string"}
+            ]
+        }
+    },
+    "additionalProperties": True
+}
 
-def load_schema(path: Path) -> dict:
-    """Load JSON schema from file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+# Pickled once so every fixed badge gets an independent deep copy; a shallow
+# dict.copy() would share the nested anyOf/enum lists between all of them
+_BADGE_TEMPLATE_BYTES = pickle.dumps(BADGE_OBJECT)
 
 
-def save_schema(schema: dict, path: Path) -> None:
-    """Save JSON schema to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+def mentions_badge(obj) -> bool:
+    """Cheap check whether a parsed subtree has any "badge" key at all."""
+    # Serializing runs in C, which is much faster than walking the dicts in Python
+    return b'"badge"' in dumps(obj)
 
 
 def fix_tpl_schema_badge_field(schema_obj: dict) -> dict:
@@ -37,72 +79,36 @@ def fix_tpl_schema_badge_field(schema_obj: dict) -> dict:
     if not isinstance(schema_obj, dict):
         return schema_obj
 
-    # Create a proper BadgeObject structure
-    badge_object = {
-        "type": "object",
-        "properties": {
-            "text": {
-                "anyOf": [
-                    {"type": "string"},
-                    {"type": "array", "items": {"type": "string"}},
-                    {"type": "object", "additionalProperties": True}
-                ]
-            },
-            "level": {
-                "type": "string",
-                "enum": ["success", "warning", "danger", "info", "primary"]
-            },
-            "visible": {
-                "anyOf": [
-                    {"type": "boolean"},
-                    {"type": "string"}
-                ]
-            },
-            "className": {
-                "anyOf": [
-                    {"type": "string"},
-                    {"type": "object", "additionalProperties": True}
-                ]
-            },
-            "position": {
-                "type": "string",
-                "enum": ["top-right", "top-left", "bottom-right", "bottom-left"]
-            },
-            "offset": {
-                "anyOf": [
-                    {"type": "array", "items": {"type": ["number", "string"]}},
-                    {"type": "object", "additionalProperties": True},
-                    {"type": "string"}
-                ]
-            }
-        },
-        "additionalProperties": True
-    }
-
-    # Apply the fix to all badge fields found in the object
-    fixed_count = 0
-
-    def fix_recursive(obj):
-        nonlocal fixed_count
-        if isinstance(obj, dict):
+    # Collect every dict whose badge field needs fixing, walking nested
+    # containers with an explicit stack instead of recursion
+    targets = []
+    stack = [schema_obj]
+    while stack:
+        obj = stack.pop()
+        # Parsed JSON only yields exact dict/list containers, so one type()
+        # lookup dispatches each node; scalars are pushed and simply skipped
+        node_type = type(obj)
+        if node_type is dict:
             # Check if this is a badge property that needs fixing
             if "badge" in obj:
                 badge_def = obj["badge"]
                 if badge_def is True or (isinstance(badge_def, dict) and badge_def.get("type") != "object"):
-                    obj["badge"] = badge_object.copy()
-                    fixed_count += 1
-                    logger.debug(f"Fixed badge field in properties")
+                    targets.append(obj)
+                    # The broken badge is replaced wholesale, so its subtree is not walked
+                    stack.extend(value for key, value in obj.items() if key != "badge")
+                    continue
 
-            # Recursively fix nested objects
-            for key, value in obj.items():
-                if isinstance(value, (dict, list)):
-                    fix_recursive(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                fix_recursive(item)
+            # Queue nested objects
+            stack.extend(obj.values())
+        elif node_type is list:
+            stack.extend(obj)
 
-    fix_recursive(schema_obj)
-    return schema_obj, fixed_count
+    # Materialize the fresh badge objects in one batch once the walk is done
+    for obj in targets:
+        obj["badge"] = pickle.loads(_BADGE_TEMPLATE_BYTES)
+        logger.debug("Fixed badge field in properties")
+
+    return schema_obj, len(targets)
 
 
 def fix_schema_wide_badge_issues(schema: dict) -> dict:
@@ -117,7 +123,7 @@ def fix_schema_wide_badge_issues(schema: dict) -> dict:
             continue
 
         # Special handling for TplSchema
-        if def_name == "TplSchema":
+        if def_name == "TplSchema" and mentions_badge(def_obj):
             logger.info("Fixing TplSchema badge field specifically...")
             fixed_def, count = fix_tpl_schema_badge_field(def_obj)
             definitions[def_name] = fixed_def
@@ -151,7 +157,13 @@ def main():
 
     # Load the problematic schema
     logger.info(f"Loading schema from {SCHEMA_PATH}")
-    schema = load_schema(SCHEMA_PATH)
+    raw = SCHEMA_PATH.read_bytes()
+
+    # Nothing to fix (and nothing to rewrite) if no badge appears anywhere
+    if b'"badge"' not in raw:
+        logger.info("No badge fields found, skipping")
+        return 0
+    schema = loads(raw)
 
     # Fix badge field definitions across the entire schema
     logger.info("Fixing badge field definitions...")
@@ -159,7 +171,7 @@ def main():
 
     # Save the fixed schema
     logger.info(f"Saving fixed schema to {SCHEMA_PATH}")
-    save_schema(fixed_schema, SCHEMA_PATH)
+    save_schema(fixed_schema, SCHEMA_PATH, pretty=True)
 
     logger.info("=" * 60)
     logger.info("✅ Comprehensive badge validation issues fixed!")
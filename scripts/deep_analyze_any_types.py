@@ -8,12 +8,22 @@ This script:
 3. Identifies specific patterns that lead to Any
 4. Checks what the generator sees vs what we have
 """
+import argparse
+import functools
+import heapq
 import json
 import logging
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - fall back to loading the whole file
+    ijson = None
+
+from _json_utils import dumps
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -23,6 +33,37 @@ TRANSLATED_SCHEMA = Path(__file__).parent.parent / "schema" / "schema_translated
 SIMPLIFIED_SCHEMA = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 GENERATED_MODELS = Path(__file__).parent.parent / "fastapi_amis_admin" / "amis" / "auto_generated_models.py"
 
+# One scan finds both class headers and indented annotations like "name: Any";
+# anchoring fields to leading indentation lets most lines fail on their first character
+_RE_GENERATED = re.compile(r"^(?:class\s+(?P<cls>\w+)|[ \t]+(?P<field>\w+):[ \t]+Any\b)", re.MULTILINE)
+
+# Analyses of shared sub-schema objects, keyed by (id(schema), depth, max_depth).
+# The schema itself is kept alongside so a recycled id() can't produce a false hit.
+_ANALYSIS_CACHE: Dict[Tuple[int, int, int], Tuple[Any, Dict[str, Any]]] = {}
+
+_PRIMITIVE_TYPES = ("string", "number", "integer", "boolean", "null")
+
+# Keys that give a definition / property a concrete type for the generator
+_DEF_TYPE_KEYS = frozenset(("type", "anyOf", "oneOf"))
+_PROP_TYPE_KEYS = _DEF_TYPE_KEYS | {"$ref"}
+
+# Result shape shared by every analysis; leaf fast paths copy it and fill in a few keys
+_BLANK_ANALYSIS: Dict[str, Any] = {
+    "field_name": None,
+    "definition": None,
+    "path": "",
+    "has_type": False,
+    "type_value": None,
+    "has_anyOf": False,
+    "has_oneOf": False,
+    "has_allOf": False,
+    "has_ref": False,
+    "ref_target": None,
+    "additionalProperties": None,
+    "is_primitive": False,
+    "issues": None,
+}
+
 
 def load_json(path: Path) -> Dict[str, Any]:
     """Load JSON file."""
@@ -30,42 +71,79 @@ def load_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
+def iter_definitions(path: Path) -> Iterator[Tuple[str, Any]]:
+    """Yield (name, definition) pairs, parsing one definition at a time."""
+    if ijson is None:
+        yield from load_json(path).get("definitions", {}).items()
+        return
+    with open(path, "rb") as f:
+        yield from ijson.kvitems(f, "definitions", use_float=True)
+
+
+def list_definition_names(path: Path) -> List[str]:
+    """List definition names without building any definition objects."""
+    if ijson is None:
+        return list(load_json(path).get("definitions", {}))
+    with open(path, "rb") as f:
+        return [value for prefix, event, value in ijson.parse(f) if prefix == "definitions" and event == "map_key"]
+
+
+def record_definition_names(
+    definitions: Iterable[Tuple[str, Any]], names: List[str]
+) -> Iterator[Tuple[str, Any]]:
+    """Pass definitions through unchanged, appending each name to names."""
+    for def_name, def_obj in definitions:
+        names.append(def_name)
+        yield def_name, def_obj
+
+
+def load_definitions(path: Path, names: Set[str]) -> Dict[str, Any]:
+    """Load only the named definitions in a single streaming pass."""
+    return {name: def_obj for name, def_obj in iter_definitions(path) if name in names}
+
+
 def find_any_types_in_generated() -> Dict[str, List[str]]:
     """Find all Any types in generated models and their context."""
     if not GENERATED_MODELS.exists():
         return {}
     
-    with open(GENERATED_MODELS, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Find all lines with : Any
-    any_pattern = re.compile(r'^\s+(\w+):\s+Any(?:\s+\|\s+None)?(?:\s*=\s*Field\([^)]+\))?', re.MULTILINE)
-    matches = any_pattern.findall(content)
-    
-    # Get context around each match
-    lines = content.split('\n')
     any_fields = defaultdict(list)
+    class_name = None
     
-    for i, line in enumerate(lines):
-        if ': Any' in line:
-            # Extract field name
-            field_match = re.search(r'(\w+):\s+Any', line)
-            if field_match:
-                field_name = field_match.group(1)
-                # Get class name (look backwards for class definition)
-                class_name = None
-                for j in range(i, max(0, i-20), -1):
-                    class_match = re.search(r'^class\s+(\w+)', lines[j])
-                    if class_match:
-                        class_name = class_match.group(1)
-                        break
-                
-                if class_name:
-                    any_fields[class_name].append(field_name)
+    # Single forward scan: remember the last class header and attribute
+    # each Any annotation to it
+    content = GENERATED_MODELS.read_text(encoding="utf-8")
+    for match in _RE_GENERATED.finditer(content):
+        if match.group("cls"):
+            class_name = match.group("cls")
+        elif class_name:
+            any_fields[class_name].append(match.group("field"))
     
     return dict(any_fields)
 
 
+def _rebase_analysis(
+    analysis: Dict[str, Any], def_name: str, field_name: str, old_path: str, new_path: str
+) -> Dict[str, Any]:
+    """Copy a cached analysis, relabelling it for another field and path."""
+    result = dict(analysis)
+    if "path" in result:
+        result["field_name"] = field_name
+        result["definition"] = def_name
+        result["path"] = new_path + result["path"][len(old_path):]
+    for union_key in ("anyOf", "oneOf", "allOf"):
+        items_key = f"{union_key}_items"
+        if items_key in result:
+            result[items_key] = [
+                _rebase_analysis(item, def_name, field_name, old_path, new_path) for item in result[items_key]
+            ]
+    if "additionalProperties_schema" in result:
+        result["additionalProperties_schema"] = _rebase_analysis(
+            result["additionalProperties_schema"], def_name, field_name, old_path, new_path
+        )
+    return result
+
+
 def analyze_field_in_schema(
     def_name: str,
     field_name: str,
@@ -74,35 +152,74 @@ def analyze_field_in_schema(
     depth: int = 0,
     max_depth: int = 10,
 ) -> Dict[str, Any]:
-    """Deeply analyze a specific field in the schema."""
+    """
+    Deeply analyze a specific field in the schema, reusing results for shared sub-schemas.
+    
+    Nested unions and additionalProperties are walked with an explicit
+    stack; each child's analysis is written into the slot its parent
+    reserved for it.
+    """
+    root: Dict[str, Any] = {}
+    stack = deque([(schema, path, depth, root, "result")])
+    while stack:
+        node, node_path, node_depth, slot, slot_key = stack.pop()
+        key = (id(node), node_depth, max_depth)
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None and cached[0] is node:
+            analysis = cached[1]
+            slot[slot_key] = _rebase_analysis(analysis, def_name, field_name, analysis.get("path", ""), node_path)
+            continue
+        
+        analysis, children = _analyze_node(def_name, field_name, node, node_path, node_depth, max_depth)
+        _ANALYSIS_CACHE[key] = (node, analysis)
+        slot[slot_key] = analysis
+        # The stack is LIFO, so a node's subtree is finished before any
+        # sibling that could hit its cache entry is popped
+        stack.extend(children)
+    return root["result"]
+
+
+def _analyze_node(
+    def_name: str,
+    field_name: str,
+    schema: Dict[str, Any],
+    path: str,
+    depth: int,
+    max_depth: int,
+) -> Tuple[Dict[str, Any], List[Tuple[Any, str, int, Any, Any]]]:
+    """Analyze one schema node, returning its result and the child nodes still to analyze."""
+    children: List[Tuple[Any, str, int, Any, Any]] = []
     if depth > max_depth:
-        return {"error": "max_depth exceeded"}
-    
-    result = {
-        "field_name": field_name,
-        "definition": def_name,
-        "path": path,
-        "has_type": False,
-        "type_value": None,
-        "has_anyOf": False,
-        "has_oneOf": False,
-        "has_allOf": False,
-        "has_ref": False,
-        "ref_target": None,
-        "additionalProperties": None,
-        "is_primitive": False,
-        "issues": [],
-    }
+        return {"error": "max_depth exceeded"}, children
+    
+    result = _BLANK_ANALYSIS.copy()
+    result["field_name"] = field_name
+    result["definition"] = def_name
+    result["path"] = path
+    result["issues"] = []
+    
+    # Fast path for the common single-key leaves {"$ref": ...} and {"type": <primitive>}
+    if type(schema) is dict and len(schema) == 1:
+        if "$ref" in schema:
+            result["has_ref"] = True
+            result["ref_target"] = schema["$ref"]
+            return result, children
+        type_value = schema.get("type")
+        if type_value in _PRIMITIVE_TYPES:
+            result["has_type"] = True
+            result["type_value"] = type_value
+            result["is_primitive"] = True
+            return result, children
     
     if not isinstance(schema, dict):
         result["issues"].append(f"Schema is not a dict: {type(schema)}")
-        return result
+        return result, children
     
     # Check for type
     if "type" in schema:
         result["has_type"] = True
         result["type_value"] = schema["type"]
-        if schema["type"] in ("string", "number", "integer", "boolean", "null"):
+        if schema["type"] in _PRIMITIVE_TYPES:
             result["is_primitive"] = True
     
     # Check for unions
@@ -112,12 +229,10 @@ def analyze_field_in_schema(
             union_items = schema[union_key]
             if isinstance(union_items, list):
                 result[f"{union_key}_count"] = len(union_items)
-                result[f"{union_key}_items"] = []
-                for idx, item in enumerate(union_items[:5]):  # First 5
-                    item_analysis = analyze_field_in_schema(
-                        def_name, field_name, item, f"{path}.{union_key}[{idx}]", depth + 1, max_depth
-                    )
-                    result[f"{union_key}_items"].append(item_analysis)
+                items = union_items[:5]  # First 5
+                item_slots = result[f"{union_key}_items"] = [None] * len(items)
+                for idx, item in enumerate(items):
+                    children.append((item, f"{path}.{union_key}[{idx}]", depth + 1, item_slots, idx))
     
     # Check for $ref
     if "$ref" in schema:
@@ -133,10 +248,8 @@ def analyze_field_in_schema(
                 result["issues"].append("additionalProperties: true (allows any value)")
         elif isinstance(ap, dict):
             result["additionalProperties"] = "object"
-            ap_analysis = analyze_field_in_schema(
-                def_name, field_name, ap, f"{path}.additionalProperties", depth + 1, max_depth
-            )
-            result["additionalProperties_schema"] = ap_analysis
+            result["additionalProperties_schema"] = None
+            children.append((ap, f"{path}.additionalProperties", depth + 1, result, "additionalProperties_schema"))
     
     # Check if it's just "true" (allows any)
     if schema is True:
@@ -147,14 +260,48 @@ def analyze_field_in_schema(
         if "additionalProperties" not in schema or schema.get("additionalProperties") is True:
             result["issues"].append("No type information, only additionalProperties: true")
     
-    return result
+    return result, children
+
+
+def build_definition_index(definition_names: Iterable[str]) -> Dict[str, str]:
+    """Map lowercased definition names to the names as they appear in the schema."""
+    index: Dict[str, str] = {}
+    for name in definition_names:
+        index.setdefault(name.lower(), name)
+    return index
+
+
+def resolve_definition_name(class_name: str, index: Dict[str, str]) -> str:
+    """Map a generated class name to the schema definition it came from."""
+    # Class names often map to schema definitions
+    def_name = class_name.replace("Schema", "").replace("Loose", "")
+    lowered = class_name.lower()
+    
+    # Try exact (case-insensitive) matches first
+    match = index.get(lowered) or index.get(def_name.lower())
+    if match:
+        return match
+    # Try variations
+    for key_lower, key in index.items():
+        if lowered in key_lower or key_lower in lowered:
+            return key
+    return def_name
+
+
+@functools.lru_cache(maxsize=1024)
+def _field_name_variants(field_name: str) -> Tuple[str, ...]:
+    """Schema property names a generated field may come from: as-is, no underscores, camelCase."""
+    parts = field_name.split("_")
+    camel = parts[0] + "".join(part.capitalize() for part in parts[1:])
+    return (field_name, field_name.replace("_", ""), camel)
 
 
 def trace_field_to_schema(
     class_name: str,
     field_name: str,
-    original_schema: Dict[str, Any],
-    simplified_schema: Dict[str, Any],
+    def_name: str,
+    orig_defs: Dict[str, Any],
+    simp_defs: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Trace a field from generated model back to schema definitions."""
     result = {
@@ -167,24 +314,8 @@ def trace_field_to_schema(
         "differences": [],
     }
     
-    orig_defs = original_schema.get("definitions", {})
-    simp_defs = simplified_schema.get("definitions", {})
-    
-    # Try to find the class definition
-    # Class names often map to schema definitions
-    def_name = class_name.replace("Schema", "").replace("Loose", "")
-    
-    # Try exact match first
-    if class_name in orig_defs:
-        def_name = class_name
-    elif def_name in orig_defs:
-        pass  # Use def_name
-    else:
-        # Try variations
-        for key in orig_defs.keys():
-            if class_name.lower() in key.lower() or key.lower() in class_name.lower():
-                def_name = key
-                break
+    # Convert field_name to schema name (camelCase or snake_case)
+    schema_field_names = _field_name_variants(field_name)
     
     if def_name in orig_defs:
         result["found_in_original"] = True
@@ -193,13 +324,6 @@ def trace_field_to_schema(
         # Find the field in properties
         if "properties" in orig_def:
             orig_props = orig_def["properties"]
-            # Convert field_name to schema name (camelCase or snake_case)
-            schema_field_names = [
-                field_name,  # Original
-                field_name.replace("_", ""),  # Remove underscores
-                "".join(word.capitalize() if i > 0 else word for i, word in enumerate(field_name.split("_"))),  # camelCase
-            ]
-            
             for schema_field in schema_field_names:
                 if schema_field in orig_props:
                     result["original_analysis"] = analyze_field_in_schema(
@@ -213,12 +337,6 @@ def trace_field_to_schema(
         
         if "properties" in simp_def:
             simp_props = simp_def["properties"]
-            schema_field_names = [
-                field_name,
-                field_name.replace("_", ""),
-                "".join(word.capitalize() if i > 0 else word for i, word in enumerate(field_name.split("_"))),
-            ]
-            
             for schema_field in schema_field_names:
                 if schema_field in simp_props:
                     result["simplified_analysis"] = analyze_field_in_schema(
@@ -243,22 +361,38 @@ def trace_field_to_schema(
     return result
 
 
-def analyze_common_any_patterns() -> Dict[str, Any]:
-    """Analyze common patterns that lead to Any types."""
-    logger.info("Loading schemas...")
-    original = load_json(ORIGINAL_SCHEMA)
-    simplified = load_json(SIMPLIFIED_SCHEMA)
+def analyze_common_any_patterns(orig_index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Analyze common patterns that lead to Any types.
+    
+    orig_index is the build_definition_index() of the original schema; it is
+    read from the file when the caller has not already collected it.
+    """
+    _ANALYSIS_CACHE.clear()
     
     logger.info("Finding Any types in generated models...")
     any_fields = find_any_types_in_generated()
     
-    logger.info(f"Found {sum(len(fields) for fields in any_fields.values())} Any fields across {len(any_fields)} classes")
+    # Count each class's fields once and reuse the counts for the total and the ranking
+    counted = [(class_name, fields, len(fields)) for class_name, fields in any_fields.items()]
+    total_any_fields = sum(count for _, _, count in counted)
+    logger.info(f"Found {total_any_fields} Any fields across {len(any_fields)} classes")
     
-    # Analyze top 10 classes with most Any fields
-    top_classes = sorted(any_fields.items(), key=lambda x: len(x[1]), reverse=True)[:10]
+    # Analyze top 10 classes with most Any fields (nlargest keeps sorted()'s tie order)
+    top_classes = [(class_name, fields) for class_name, fields, _ in heapq.nlargest(10, counted, key=lambda t: t[2])]
+    
+    # Resolve class names against the key list, then materialize only the
+    # definitions those classes map to
+    logger.info("Loading referenced definitions...")
+    if orig_index is None:
+        orig_index = build_definition_index(list_definition_names(ORIGINAL_SCHEMA))
+    def_names = {class_name: resolve_definition_name(class_name, orig_index) for class_name, _ in top_classes}
+    wanted = set(def_names.values())
+    original = load_definitions(ORIGINAL_SCHEMA, wanted)
+    simplified = load_definitions(SIMPLIFIED_SCHEMA, wanted)
     
     analysis = {
-        "total_any_fields": sum(len(fields) for fields in any_fields.values()),
+        "total_any_fields": total_any_fields,
         "total_classes_with_any": len(any_fields),
         "top_classes": {},
     }
@@ -273,66 +407,79 @@ def analyze_common_any_patterns() -> Dict[str, Any]:
         
         # Analyze first 5 fields
         for field_name in fields[:5]:
-            trace = trace_field_to_schema(class_name, field_name, original, simplified)
+            trace = trace_field_to_schema(class_name, field_name, def_names[class_name], original, simplified)
             class_analysis["fields"][field_name] = trace
         
         analysis["top_classes"][class_name] = class_analysis
     
+    # Cached entries pin the loaded definitions in memory
+    _ANALYSIS_CACHE.clear()
     return analysis
 
 
-def find_schema_patterns_leading_to_any(schema: Dict[str, Any]) -> Dict[str, List[str]]:
-    """Find patterns in schema that will lead to Any types."""
-    patterns = defaultdict(list)
-    definitions = schema.get("definitions", {})
+def find_schema_patterns_leading_to_any(definitions: Iterable[Tuple[str, Any]]) -> Dict[str, List[str]]:
+    """Find patterns in schema definitions that will lead to Any types."""
+    patterns: Dict[str, List[str]] = {}
     
-    for def_name, def_obj in definitions.items():
+    for def_name, def_obj in definitions:
         if not isinstance(def_obj, dict):
             continue
         
         # Pattern 1: additionalProperties: true
         if def_obj.get("additionalProperties") is True:
-            patterns["additionalProperties_true"].append(def_name)
+            patterns.setdefault("additionalProperties_true", []).append(def_name)
         
         # Pattern 2: No type, no anyOf, just object
-        if "type" not in def_obj and "anyOf" not in def_obj and "oneOf" not in def_obj:
-            if "properties" not in def_obj or not def_obj.get("properties"):
-                patterns["no_type_info"].append(def_name)
+        properties = def_obj.get("properties")
+        if not properties and def_obj.keys().isdisjoint(_DEF_TYPE_KEYS):
+            patterns.setdefault("no_type_info", []).append(def_name)
         
         # Pattern 3: Check properties
-        if "properties" in def_obj:
-            for prop_name, prop_schema in def_obj["properties"].items():
-                if isinstance(prop_schema, dict):
-                    # Property with additionalProperties: true
-                    if prop_schema.get("additionalProperties") is True:
-                        patterns["property_additionalProperties_true"].append(f"{def_name}.{prop_name}")
-                    
-                    # Property that's just true
-                    if prop_schema is True:
-                        patterns["property_is_true"].append(f"{def_name}.{prop_name}")
-                    
-                    # Property with no type and no union
-                    if "type" not in prop_schema and "anyOf" not in prop_schema and "oneOf" not in prop_schema and "$ref" not in prop_schema:
-                        if prop_schema.get("additionalProperties") is True:
-                            patterns["property_no_type"].append(f"{def_name}.{prop_name}")
-    
-    return dict(patterns)
-
-
-def main() -> int:
+        if not properties:
+            continue
+        for prop_name, prop_schema in properties.items():
+            # Property that's just true
+            if prop_schema is True:
+                patterns.setdefault("property_is_true", []).append(f"{def_name}.{prop_name}")
+                continue
+            if not isinstance(prop_schema, dict) or prop_schema.get("additionalProperties") is not True:
+                continue
+            
+            # Property with additionalProperties: true, and possibly no type or union either
+            prop_path = f"{def_name}.{prop_name}"
+            patterns.setdefault("property_additionalProperties_true", []).append(prop_path)
+            if prop_schema.keys().isdisjoint(_PROP_TYPE_KEYS):
+                patterns.setdefault("property_no_type", []).append(prop_path)
+    
+    return patterns
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze why Any types are generated.")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the JSON report for reading (default: compact)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main analysis function."""
+    args = parse_args(argv)
+    
     logger.info("=" * 80)
     logger.info("DEEP ANALYSIS: Why Any Types Are Generated")
     logger.info("=" * 80)
     
-    # Load schemas
-    logger.info("\n1. Loading schemas...")
-    original = load_json(ORIGINAL_SCHEMA)
-    simplified = load_json(SIMPLIFIED_SCHEMA)
+    # Stream definitions from the original schema, keeping their names so
+    # the Any tracing below doesn't need another pass over the file
+    logger.info("\n1. Streaming original schema definitions...")
+    orig_names: List[str] = []
     
     # Find patterns in original schema
     logger.info("\n2. Analyzing patterns in original schema...")
-    orig_patterns = find_schema_patterns_leading_to_any(original)
+    orig_patterns = find_schema_patterns_leading_to_any(
+        record_definition_names(iter_definitions(ORIGINAL_SCHEMA), orig_names)
+    )
     
     print("\n" + "=" * 80)
     print("PATTERNS IN ORIGINAL SCHEMA THAT LEAD TO ANY:")
@@ -346,7 +493,7 @@ def main() -> int:
     
     # Analyze Any types in generated code
     logger.info("\n3. Analyzing Any types in generated models...")
-    any_analysis = analyze_common_any_patterns()
+    any_analysis = analyze_common_any_patterns(build_definition_index(orig_names))
     
     print("\n" + "=" * 80)
     print("ANY TYPES IN GENERATED MODELS:")
@@ -370,11 +517,11 @@ def main() -> int:
     
     # Save detailed report
     report_path = Path(__file__).parent.parent / "any_types_analysis_report.json"
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "patterns": orig_patterns,
-            "any_analysis": any_analysis,
-        }, f, indent=2, ensure_ascii=False)
+    report = {
+        "patterns": orig_patterns,
+        "any_analysis": any_analysis,
+    }
+    report_path.write_bytes(dumps(report, pretty=args.pretty))
     
     logger.info(f"\nDetailed report saved to: {report_path}")
     
@@ -10,68 +10,99 @@ import logging
 from pathlib import Path
 import re
 
+from _json_utils import dumps, loads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
+# Comma repairs, only needed when the file on disk is not valid JSON
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_MULTI_COMMA = re.compile(r',{2,}')
+_EMPTY_OBJ_HEAD = re.compile(r'\{\s*,')
+_EMPTY_ARR_HEAD = re.compile(r'\[\s*,')
 
-def deep_cleanup_schema():
-    """
-    Perform deep cleanup of the schema file.
-    """
-    logger.info("Loading schema for deep cleanup...")
-    with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
-        content = f.read()
+_BAD_NAME = "JsonSchemaObject"
 
-    original_size = len(content)
-    logger.info(f"Original schema size: {original_size:,} bytes")
 
-    # Step 1: Remove JsonSchemaObject definitions entirely
-    logger.info("Step 1: Removing JsonSchemaObject definitions...")
-    content = re.sub(r'"JsonSchemaObject":\s*\{[^}]*\}', '', content)
+def _repair_commas(content):
+    """Drop stray commas that json.loads rejects."""
+    content = _MULTI_COMMA.sub(',', content)
+    content = _EMPTY_OBJ_HEAD.sub('{', content)
+    content = _EMPTY_ARR_HEAD.sub('[', content)
+    return _TRAILING_COMMA.sub(r'\1', content)
 
-    # Step 2: Remove JsonSchemaObject references
-    logger.info("Step 2: Removing JsonSchemaObject references...")
-    content = content.replace('"JsonSchemaObject"', '"object"')
-    content = content.replace('JsonSchemaObject', 'object')
 
-    # Step 3: Fix malformed structures
-    logger.info("Step 3: Fixing malformed structures...")
+def _strip_json_schema_object(node):
+    """
+    Drop JsonSchemaObject definitions and point every reference at "object".
 
-    # Remove trailing commas before } or ]
-    content = re.sub(r',(\s*[}\]])', r'\1', content)
+    Works on the parsed schema, so nested braces inside the definition
+    cannot leave half an object behind the way a text regex would.
+    Containers are edited in place; a dict is only rebuilt (keeping key
+    order) when one of its keys has to change.
+    """
+    if isinstance(node, dict):
+        if any(_BAD_NAME in key for key in node):
+            node = {
+                key.replace(_BAD_NAME, "object"): value
+                for key, value in node.items()
+                if not (key == _BAD_NAME and isinstance(value, dict))
+            }
+        for key, value in node.items():
+            cleaned = _strip_json_schema_object(value)
+            if cleaned is not value:
+                node[key] = cleaned
+        return node
+    if isinstance(node, list):
+        for idx, item in enumerate(node):
+            cleaned = _strip_json_schema_object(item)
+            if cleaned is not item:
+                node[idx] = cleaned
+        return node
+    if isinstance(node, str) and _BAD_NAME in node:
+        return node.replace(_BAD_NAME, "object")
+    return node
 
-    # Fix multiple consecutive commas
-    content = re.sub(r',,+,', ',', content)
 
-    # Fix empty objects
-    content = re.sub(r'\{\s*,', '{', content)
-    content = re.sub(r',\s*\}', '}', content)
+def deep_cleanup_schema():
+    """
+    Perform deep cleanup of the schema file.
+    """
+    logger.info("Loading schema for deep cleanup...")
+    content = SCHEMA_PATH.read_bytes()
 
-    # Fix empty arrays
-    content = re.sub(r'\[\s*,', '[', content)
-    content = re.sub(r',\s*\]', ']', content)
+    original_size = len(content)
+    logger.info(f"Original schema size: {original_size:,} bytes")
 
-    # Step 4: Ensure proper JSON structure
-    logger.info("Step 4: Validating JSON structure...")
+    # Step 1: Parse, repairing stray commas only if the file is malformed
+    logger.info("Step 1: Validating JSON structure...")
     try:
-        schema = json.loads(content)
+        schema = loads(content)
         logger.info("JSON structure is valid")
+    # orjson's JSONDecodeError subclasses json's, so this catches both
     except json.JSONDecodeError as e:
         logger.error(f"JSON validation failed: {e}")
-        # Try to fix common issues
-        content = re.sub(r',\s*}', '}', content)
-        content = re.sub(r',\s*]', ']', content)
         try:
-            schema = json.loads(content)
+            schema = loads(_repair_commas(content.decode("utf-8")))
             logger.info("JSON structure fixed and is now valid")
         except json.JSONDecodeError as e2:
             logger.error(f"Failed to fix JSON structure: {e2}")
             return False
+    has_bad_name = _BAD_NAME.encode() in content
+    del content
+
+    # Step 2: Remove JsonSchemaObject definitions and references
+    logger.info("Step 2: Removing JsonSchemaObject definitions and references...")
+    # One C-level scan of the raw bytes decides whether the walk is needed
+    if has_bad_name:
+        schema = _strip_json_schema_object(schema)
+    else:
+        logger.info("No JsonSchemaObject found, nothing to remove")
 
-    # Step 5: Add missing object definition if needed
-    logger.info("Step 5: Ensuring object definition exists...")
+    # Step 3: Add missing object definition if needed
+    logger.info("Step 3: Ensuring object definition exists...")
     definitions = schema.get("definitions", {})
     if "object" not in definitions:
         definitions["object"] = {
@@ -80,12 +111,12 @@ def deep_cleanup_schema():
         }
         logger.info("Added object definition")
 
-    # Step 6: Save cleaned schema
-    logger.info("Step 6: Saving cleaned schema...")
-    with open(SCHEMA_PATH, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+    # Step 4: Save cleaned schema
+    logger.info("Step 4: Saving cleaned schema...")
+    data = dumps(schema, pretty=True)
+    SCHEMA_PATH.write_bytes(data)
 
-    new_size = len(json.dumps(schema))
+    new_size = len(data)
     logger.info(f"Cleaned schema size: {new_size:,} bytes")
     logger.info(f"Size change: {new_size - original_size:+,} bytes")
 
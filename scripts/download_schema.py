@@ -8,11 +8,21 @@ and downloads the schema.json file to the schema/ directory.
 import json
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - fall back to a full parse
+    ijson = None
+
+from _json_utils import loads
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +38,27 @@ SCHEMA_ASSET_NAME = "schema.json"
 DEFAULT_OUTPUT_PATH = Path(__file__).parent.parent / "schema" / "schema.json"
 TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5  # seconds, doubled after every failed attempt
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # bytes
+# Top-level keys that mark a file as a JSON Schema document
+SCHEMA_ROOT_KEYS = frozenset(("$schema", "definitions", "properties", "type", "$defs"))
+
+
+def _make_session() -> requests.Session:
+    """Create a pooled session that retries failed GETs with exponential backoff."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+# Shared by the release lookup and the asset download so connections are reused
+_SESSION = _make_session()
 
 
 def get_latest_release_info() -> dict:
@@ -47,19 +78,16 @@ def get_latest_release_info() -> dict:
         "User-Agent": "fastapi-amis-admin-schema-downloader",
     }
 
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = requests.get(GITHUB_API_URL, headers=headers, timeout=TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Latest release: {data.get('tag_name', 'unknown')}")
-            return data
-        except requests.RequestException as e:
-            if attempt < MAX_RETRIES:
-                logger.warning(f"Attempt {attempt} failed: {e}. Retrying...")
-            else:
-                logger.error(f"Failed to fetch release info after {MAX_RETRIES} attempts")
-                raise
+    try:
+        response = _SESSION.get(GITHUB_API_URL, headers=headers, timeout=TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch release info: {e}")
+        raise
+
+    logger.info(f"Latest release: {data.get('tag_name', 'unknown')}")
+    return data
 
 
 def find_schema_asset(release_info: dict) -> Optional[str]:
@@ -85,41 +113,114 @@ def find_schema_asset(release_info: dict) -> Optional[str]:
     return None
 
 
-def download_file(url: str, output_path: Path) -> None:
+def etag_path(output_path: Path) -> Path:
+    """Return the sidecar file that stores the ETag of output_path's last download."""
+    return output_path.with_suffix(".etag")
+
+
+def read_etag(output_path: Path) -> Optional[str]:
+    """Read the stored ETag for output_path, or None if the file or its ETag is missing."""
+    sidecar = etag_path(output_path)
+    if not output_path.exists() or not sidecar.exists():
+        return None
+    return sidecar.read_text(encoding="utf-8").strip() or None
+
+
+# Errors that can interrupt a response body while it streams
+_STREAM_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+
+def _download_once(url: str, output_path: Path, headers: Optional[dict], etag: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """Make a single download attempt; see download_file."""
+    with _SESSION.get(url, headers=headers, timeout=TIMEOUT, stream=True) as response:
+        if response.status_code == 304:
+            logger.info(f"{output_path} is unchanged (ETag {etag}), skipping download")
+            return False, etag
+        response.raise_for_status()
+
+        # Create parent directory if it doesn't exist
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Forget the old ETag before the file it describes is overwritten, so
+        # a failed or invalid download is never mistaken for a current copy
+        etag_path(output_path).unlink(missing_ok=True)
+
+        # iter_content decodes gzip/deflate transfer encodings and raises
+        # urllib3 read errors as requests exceptions
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+    file_size = output_path.stat().st_size
+    logger.info(f"Downloaded {file_size:,} bytes to {output_path}")
+    return True, response.headers.get("ETag")
+
+
+def download_file(url: str, output_path: Path, etag: Optional[str] = None) -> Tuple[bool, Optional[str]]:
     """
     Download a file from URL and save to output_path.
 
     Args:
         url: URL to download from.
         output_path: Path to save the downloaded file.
+        etag: ETag of the copy already at output_path; sent as If-None-Match.
+
+    Returns:
+        tuple: (downloaded, etag). downloaded is False when the server
+        answered 304 Not Modified and output_path was left untouched;
+        etag is the ETag of the response, if the server sent one.
 
     Raises:
         requests.RequestException: If download fails.
     """
     logger.info(f"Downloading from {url}")
+    headers = {"If-None-Match": etag} if etag else None
 
-    for attempt in range(1, MAX_RETRIES + 1):
+    # The session's adapter only retries until the response headers arrive;
+    # a connection that drops or stalls mid-body restarts the download here
+    for attempt in range(MAX_RETRIES + 1):
         try:
-            response = requests.get(url, timeout=TIMEOUT, stream=True)
-            response.raise_for_status()
+            return _download_once(url, output_path, headers, etag)
+        except _STREAM_ERRORS as e:
+            if attempt == MAX_RETRIES:
+                logger.error(f"Download failed: {e}")
+                raise
+            delay = BACKOFF_FACTOR * 2 ** attempt
+            logger.warning(f"Download interrupted ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+        except requests.RequestException as e:
+            logger.error(f"Download failed: {e}")
+            raise
 
-            # Create parent directory if it doesn't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+# Raised for malformed JSON by whichever parser _read_root_keys uses
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
 
-            file_size = output_path.stat().st_size
-            logger.info(f"Downloaded {file_size:,} bytes to {output_path}")
-            return
-        except requests.RequestException as e:
-            if attempt < MAX_RETRIES:
-                logger.warning(f"Download attempt {attempt} failed: {e}. Retrying...")
-            else:
-                logger.error(f"Download failed after {MAX_RETRIES} attempts")
-                raise
+
+def _read_root_keys(schema_path: Path) -> Optional[List[str]]:
+    """
+    Parse the whole file and return its top-level keys.
+
+    Returns None when the root is not a JSON object. With ijson the file is
+    checked as an event stream, so no object tree is built.
+    """
+    if ijson is None:
+        data = Path(schema_path).read_bytes()
+        schema = loads(data)
+        return list(schema) if isinstance(schema, dict) else None
+
+    root_keys: List[str] = []
+    with open(schema_path, "rb") as f:
+        events = ijson.parse(f)
+        first = next(events, None)
+        if first is None or first[1] != "start_map":
+            # Drain the stream anyway so malformed input is still reported
+            for _ in events:
+                pass
+            return None
+        for prefix, event, value in events:
+            if event == "map_key" and prefix == "":
+                root_keys.append(value)
+    return root_keys
 
 
 def validate_schema(schema_path: Path) -> bool:
@@ -135,29 +236,25 @@ def validate_schema(schema_path: Path) -> bool:
     logger.info(f"Validating schema at {schema_path}")
 
     try:
-        with open(schema_path, "r", encoding="utf-8") as f:
-            schema = json.load(f)
+        root_keys = _read_root_keys(schema_path)
 
         # Basic validation: check if it's a dict and has some expected properties
-        if not isinstance(schema, dict):
+        if root_keys is None:
             logger.error("Schema is not a JSON object")
             return False
 
         # Check for common JSON Schema properties
-        has_schema_props = any(
-            key in schema
-            for key in ["$schema", "definitions", "properties", "type", "$defs"]
-        )
+        has_schema_props = not SCHEMA_ROOT_KEYS.isdisjoint(root_keys)
 
         if not has_schema_props:
             logger.warning(
                 "Schema doesn't contain typical JSON Schema properties, but may still be valid"
             )
 
-        logger.info(f"Schema validation successful. Root keys: {list(schema.keys())}")
+        logger.info(f"Schema validation successful. Root keys: {root_keys}")
         return True
 
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         logger.error(f"Invalid JSON: {e}")
         return False
     except Exception as e:
@@ -192,14 +289,27 @@ def main(output_path: Optional[Path] = None) -> int:
             logger.error("Could not find schema.json in latest release")
             return 1
 
-        # Download schema
-        download_file(schema_url, output_path)
+        # Download schema, unless the copy we already have is current
+        downloaded, etag = download_file(schema_url, output_path, etag=read_etag(output_path))
+        if not downloaded:
+            logger.info("=" * 60)
+            logger.info("✅ Schema is already up to date")
+            logger.info(f"Location: {output_path.absolute()}")
+            logger.info("=" * 60)
+            return 0
 
         # Validate downloaded schema
         if not validate_schema(output_path):
             logger.error("Schema validation failed")
             return 1
 
+        # Only remember the ETag once the file it describes is known to be good
+        sidecar = etag_path(output_path)
+        if etag:
+            sidecar.write_text(etag, encoding="utf-8")
+        else:
+            sidecar.unlink(missing_ok=True)
+
         logger.info("=" * 60)
         logger.info("✅ Schema downloaded and validated successfully!")
         logger.info(f"Location: {output_path.absolute()}")
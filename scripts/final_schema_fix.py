@@ -4,16 +4,19 @@ Highly optimized, fully iterative schema standardization for AMIS schema.
 
 This script uses a professional, graph-based approach to be extremely fast and robust:
 1.  Builds a lightweight dependency graph of all definitions.
-2.  Runs a fast cycle detection algorithm on the small graph to identify all
-    definitions that are part of any cycle.
+2.  Runs Tarjan's strongly connected components algorithm on the small graph
+    to identify all definitions that are part of any cycle.
 3.  Performs a single, fast, and FULLY ITERATIVE pass over the schema to apply all
     fixes, making it immune to recursion depth errors.
 """
 
-import json
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from _badge_schema import create_valid_badge_object
+from _json_utils import dumps, load_schema, save_schema
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -21,29 +24,62 @@ logger = logging.getLogger(__name__)
 INPUT_SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_translated.json"
 OUTPUT_SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
-def create_valid_badge_object() -> Dict[str, Any]:
-    """Creates a known-good schema for the Badge object."""
+# In compact JSON a "$ref" key can only appear unescaped outside string values
+REF_PATTERN = re.compile(rb'"\$ref":"([^"]*)"')
+
+def find_all_refs(obj: Any) -> Set[str]:
+    """Finds all unique $ref names within a JSON object by scanning its serialized bytes."""
     return {
-        "type": "object",
-        "properties": {
-            "text": {"anyOf": [{"type": "string"}, {"type": "number"}]},
-            "level": {"type": "string", "enum": ["success", "warning", "danger", "info", "primary"]},
-        },
-        "additionalProperties": True,
+        ref.decode("utf-8").rsplit("/", 1)[-1]
+        for ref in REF_PATTERN.findall(dumps(obj))
     }
 
-def find_all_refs(obj: Any) -> Set[str]:
-    """Recursively finds all unique $ref values within a JSON object."""
-    refs = set()
-    if isinstance(obj, dict):
-        if "$ref" in obj and isinstance(obj["$ref"], str):
-            refs.add(obj["$ref"].split("/")[-1])
-        for value in obj.values():
-            refs.update(find_all_refs(value))
-    elif isinstance(obj, list):
-        for item in obj:
-            refs.update(find_all_refs(item))
-    return refs
+def strongly_connected_components(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """
+    Iterative Tarjan's algorithm over a name -> referenced-names graph.
+    References to names that are not graph nodes are ignored.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    scc_stack: List[str] = []
+    components: List[List[str]] = []
+
+    def visit(node: str) -> Iterator[str]:
+        index[node] = lowlink[node] = len(index)
+        scc_stack.append(node)
+        on_stack.add(node)
+        return iter(graph[node])
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, visit(root))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in graph:
+                    continue
+                if neighbor not in index:
+                    work.append((neighbor, visit(neighbor)))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
 
 def find_cyclic_definitions(definitions: Dict[str, Any]) -> Set[str]:
     """
@@ -53,79 +89,83 @@ def find_cyclic_definitions(definitions: Dict[str, Any]) -> Set[str]:
     logger.info("Building schema dependency graph...")
     graph = {name: find_all_refs(defn) for name, defn in definitions.items()}
 
-    visiting = set()
-    visited = set()
+    logger.info("Detecting all cyclic definitions in the graph...")
     cyclic_nodes = set()
+    for component in strongly_connected_components(graph):
+        # A single definition is only cyclic if it references itself
+        if len(component) > 1 or component[0] in graph[component[0]]:
+            cyclic_nodes.update(component)
 
-    def dfs(node):
-        visiting.add(node)
-        for neighbor in graph.get(node, []):
-            if neighbor in cyclic_nodes:
-                cyclic_nodes.add(node)
-                continue
-            if neighbor in visiting:
-                cyclic_nodes.add(neighbor)
-                cyclic_nodes.add(node)
-                continue
-            if neighbor not in visited:
-                if dfs(neighbor):
-                    cyclic_nodes.add(node)
-        visiting.remove(node)
-        visited.add(node)
-        return node in cyclic_nodes
-
-    logger.info("Detecting all cyclic definitions in the graph...")
-    for node in graph:
-        if node not in visited:
-            dfs(node)
-            
     logger.info(f"Found {len(cyclic_nodes)} definitions involved in cycles.")
     return cyclic_nodes
 
-def apply_fixes_iterative(schema: Dict[str, Any], cyclic_definitions: Set[str]) -> Tuple[Dict[str, Any], int]:
+def fix_type_list(obj: Dict[str, Any]) -> int:
+    """Rewrites `type: ["string", "number"]` as an `anyOf` of single types."""
+    if isinstance(obj.get("type"), list):
+        obj["anyOf"] = [{"type": t} for t in obj.pop("type")]
+        return 1
+    return 0
+
+def fix_cyclic_ref(obj: Dict[str, Any], cyclic_definitions: Set[str]) -> int:
+    """Wraps a $ref to a cyclic definition in a single-item `anyOf`."""
+    ref = obj.get("$ref")
+    if isinstance(ref, str) and ref.rsplit("/", 1)[-1] in cyclic_definitions:
+        obj["anyOf"] = [{"$ref": obj.pop("$ref")}]
+        return 1
+    return 0
+
+def apply_fixes_iterative(
+    schema: Dict[str, Any],
+    cyclic_definitions: Set[str],
+    mutators: Iterable[Callable[[Dict[str, Any]], int]] = (),
+) -> Tuple[Dict[str, Any], int]:
     """
     Performs a single, fully iterative pass to fix structural issues and wrap cyclic $refs.
-    This is immune to RecursionError.
+    Each dict gets the type-list fix, the cyclic $ref wrap and then every extra
+    mutator, in order, before its children are pushed. This is immune to RecursionError.
     """
+    mutators = tuple(mutators)
     fixes_applied = 0
     stack = [schema]
-    processed_ids = set()
+    # Objects are marked when pushed so shared sub-schemas enter the stack once.
+    # Every marked object stays reachable from `schema`, so ids are not reused.
+    processed_ids = {id(schema)}
+    # {"$ref": ...} objects created by a cyclic wrap; they are visited, but never wrapped again
+    wrapped_ids = set()
 
-    logger.info("Applying all fixes in a single, non-recursive pass...")
-    
+    # Exact type checks are cheaper than isinstance; JSON loaders never produce subclasses
     while stack:
         obj = stack.pop()
         
-        obj_id = id(obj)
-        if obj_id in processed_ids:
-            continue
-        
-        if isinstance(obj, dict):
-            processed_ids.add(obj_id)
-            # Fix structural issue: `type: ["string", "number"]`
-            if "type" in obj and isinstance(obj["type"], list):
-                obj["anyOf"] = [{"type": t} for t in obj.pop("type")]
+        if type(obj) is dict:
+            fixes_applied += fix_type_list(obj)
+            if id(obj) not in wrapped_ids and fix_cyclic_ref(obj, cyclic_definitions):
                 fixes_applied += 1
-            
-            # Fix cyclic $ref
-            if "$ref" in obj and isinstance(obj["$ref"], str):
-                ref_name = obj["$ref"].split("/")[-1]
-                if ref_name in cyclic_definitions:
-                    ref = obj.pop("$ref")
-                    obj["anyOf"] = [{"$ref": ref}]
-                    fixes_applied += 1
-            
-            for value in obj.values():
-                if isinstance(value, (dict, list)):
-                    stack.append(value)
-        elif isinstance(obj, list):
-            processed_ids.add(obj_id)
-            for item in obj:
-                if isinstance(item, (dict, list)):
-                    stack.append(item)
+                wrapped_ids.add(id(obj["anyOf"][0]))
+            for mutator in mutators:
+                fixes_applied += mutator(obj)
+            children = obj.values()
+        else:
+            children = obj
+
+        for child in children:
+            if (type(child) is dict or type(child) is list) and id(child) not in processed_ids:
+                processed_ids.add(id(child))
+                stack.append(child)
 
     return schema, fixes_applied
 
+def fix_tplschema_badge(definitions: Dict[str, Any]) -> int:
+    """Replaces every TplSchema.allOf badge that is not the known-good Badge object."""
+    fixes_applied = 0
+    badge = create_valid_badge_object()
+    for item in definitions.get("TplSchema", {}).get("allOf", []):
+        if "properties" in item and "badge" in item["properties"]:
+            if item["properties"]["badge"] != badge:
+                item["properties"]["badge"] = create_valid_badge_object()
+                fixes_applied += 1
+    return fixes_applied
+
 def main() -> int:
     """Main function to run the schema standardization."""
     logger.info("=" * 70)
@@ -137,27 +177,21 @@ def main() -> int:
         return 1
 
     logger.info(f"Loading schema from: {INPUT_SCHEMA_PATH}")
-    schema = json.loads(INPUT_SCHEMA_PATH.read_text(encoding="utf-8"))
+    schema = load_schema(INPUT_SCHEMA_PATH)
     definitions = schema.get("definitions", {})
 
     # --- Run Optimized Passes ---
     cyclic_defs = find_cyclic_definitions(definitions)
+    logger.info("Applying all fixes in a single, non-recursive pass...")
     schema, total_fixes = apply_fixes_iterative(schema, cyclic_defs)
 
     # --- Final Targeted Fixes ---
     logger.info("Applying final targeted fixes...")
-    if 'TplSchema' in definitions:
-        tpl_schema = definitions['TplSchema']
-        if 'allOf' in tpl_schema:
-            for item in tpl_schema.get('allOf', []):
-                if 'properties' in item and 'badge' in item['properties']:
-                    if item['properties']['badge'] != create_valid_badge_object():
-                        item['properties']['badge'] = create_valid_badge_object()
-                        total_fixes += 1
+    total_fixes += fix_tplschema_badge(definitions)
     
     # --- Save ---
     logger.info(f"Saving standardized schema to: {OUTPUT_SCHEMA_PATH}")
-    OUTPUT_SCHEMA_PATH.write_text(json.dumps(schema, indent=2, ensure_ascii=False), encoding="utf-8")
+    save_schema(schema, OUTPUT_SCHEMA_PATH, pretty=True)
 
     logger.info("\n" + "=" * 70)
     logger.info("✅ Schema standardization complete!")
@@ -3,7 +3,6 @@
 Find actual duplicate field definitions in generated models.
 """
 import ast
-import re
 from collections import defaultdict
 from pathlib import Path
 
@@ -23,36 +22,27 @@ def find_duplicate_fields():
     
     duplicates_found = []
     
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            field_names = []
-            field_lines = {}
-            
-            for item in node.body:
-                if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                    field_name = item.target.id
-                    field_names.append(field_name)
-                    if field_name not in field_lines:
-                        field_lines[field_name] = []
-                    field_lines[field_name].append(item.lineno)
-            
-            # Find duplicates
-            seen = set()
-            duplicates = {}
-            for field_name in field_names:
-                if field_name in seen:
-                    if field_name not in duplicates:
-                        duplicates[field_name] = []
-                    duplicates[field_name].append(field_lines[field_name][-1])
-                else:
-                    seen.add(field_name)
-            
-            if duplicates:
-                duplicates_found.append({
-                    "class": node.name,
-                    "line": node.lineno,
-                    "duplicates": duplicates,
-                })
+    # Only class bodies hold fields: start from module-level classes and
+    # descend into classes nested directly in a class body, nothing else.
+    classes = [node for node in ast.iter_child_nodes(tree) if isinstance(node, ast.ClassDef)]
+    
+    for node in classes:
+        field_lines = defaultdict(list)
+        
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                field_lines[item.target.id].append(item.lineno)
+            elif isinstance(item, ast.ClassDef):
+                classes.append(item)
+        
+        duplicates = {name: lines for name, lines in field_lines.items() if len(lines) > 1}
+        
+        if duplicates:
+            duplicates_found.append({
+                "class": node.name,
+                "line": node.lineno,
+                "duplicates": duplicates,
+            })
     
     if duplicates_found:
         print("=" * 80)
@@ -64,34 +54,6 @@ def find_duplicate_fields():
                 print(f"  - {field}: appears on lines {lines}")
     else:
         print("No duplicate field definitions found in AST.")
-    
-    # Also check using regex for fields that appear multiple times
-    print("\n" + "=" * 80)
-    print("CHECKING FOR MULTIPLE FIELD DEFINITIONS (regex):")
-    print("=" * 80)
-    
-    lines = content.split('\n')
-    current_class = None
-    class_fields = defaultdict(lambda: defaultdict(list))
-    
-    for i, line in enumerate(lines, 1):
-        class_match = re.match(r'^class\s+(\w+)', line)
-        if class_match:
-            current_class = class_match.group(1)
-            continue
-        
-        if current_class:
-            field_match = re.match(r'^\s+(\w+):\s+', line)
-            if field_match:
-                field_name = field_match.group(1)
-                class_fields[current_class][field_name].append(i)
-    
-    for class_name, fields in class_fields.items():
-        duplicates = {name: lines for name, lines in fields.items() if len(lines) > 1}
-        if duplicates:
-            print(f"\nClass {class_name}:")
-                for field, line_nums in duplicates.items():
-                    print(f"  - {field}: appears on lines {line_nums}")
 
 
 if __name__ == "__main__":
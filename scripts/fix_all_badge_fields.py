@@ -8,91 +8,18 @@ It handles:
 2. All other schema definitions that have badge fields
 3. Converts any malformed structures to valid JSON Schema
 """
-import json
 import logging
 from pathlib import Path
 
+from _json_utils import load_schema, parse_save_args, save_schema
+from _badge_schema import create_valid_badge_object
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
 
-def load_schema(path: Path) -> dict:
-    """Load JSON schema from file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_schema(schema: dict, path: Path) -> None:
-    """Save JSON schema to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
-
-
-def create_valid_badge_object():
-    """Create a valid BadgeObject schema."""
-    return {
-        "type": "object",
-        "properties": {
-            "text": {
-                "description": "文本content",
-                "anyOf": [
-                    {"type": "string"},
-                    {"type": "number"},
-                    {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    {"type": "object", "additionalProperties": True}
-                ]
-            },
-            "level": {
-                "type": "string",
-                "enum": ["success", "warning", "danger", "info", "primary"]
-            },
-            "visible": {
-                "anyOf": [
-                    {"type": "boolean"},
-                    {"type": "string"}
-                ]
-            },
-            "className": {
-                "anyOf": [
-                    {"type": "string"},
-                    {"type": "object", "additionalProperties": True}
-                ]
-            },
-            "position": {
-                "type": "string",
-                "enum": ["top-right", "top-left", "bottom-right", "bottom-left"]
-            },
-            "offset": {
-                "type": "array",
-                "items": {
-                    "anyOf": [
-                        {"type": "number"},
-                        {"type": "string"}
-                    ]
-                },
-                "minItems": 2,
-                "maxItems": 2
-            },
-            "size": {"type": "number"},
-            "mode": {
-                "type": "string",
-                "enum": ["text", "dot", "ribbon"]
-            },
-            "overflowCount": {"type": "number"},
-            "visibleOn": {"type": "string"},
-            "animation": {"type": "boolean"},
-            "style": {"type": "object"},
-            "styleVars": {"type": "object"}
-        },
-        "additionalProperties": True
-    }
-
-
 def fix_badge_field_in_properties(properties: dict) -> int:
     """
     Fix badge field in a properties dictionary.
@@ -175,8 +102,10 @@ def fix_all_badge_fields(schema: dict) -> int:
     return total_fixes
 
 
-def main():
+def main(argv=None):
     """Main function to fix all badge field definitions."""
+    args = parse_save_args(__doc__, argv)
+
     logger.info("=" * 60)
     logger.info("Comprehensive Badge Fields Fix")
     logger.info("=" * 60)
@@ -192,7 +121,7 @@ def main():
 
     # Save the fixed schema
     logger.info(f"Saving fixed schema to {SCHEMA_PATH}")
-    save_schema(schema, SCHEMA_PATH)
+    save_schema(schema, SCHEMA_PATH, pretty=args.pretty)
 
     logger.info("=" * 60)
     logger.info("✅ All badge field definitions fixed!")
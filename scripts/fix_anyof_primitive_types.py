@@ -5,26 +5,22 @@ Fix primitive types in anyOf arrays in BadgeObject and other definitions.
 JSON Schema anyOf should contain schema objects, not primitive type strings.
 This script converts primitive type strings to proper schema objects.
 """
-import json
 import logging
 from pathlib import Path
 
+from _json_utils import dumps, load_schema, parse_save_args, save_schema
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
 
-def load_schema(path: Path) -> dict:
-    """Load JSON schema from file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_schema(schema: dict, path: Path) -> None:
-    """Save JSON schema to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+# One shared, never-mutated schema object per primitive type name
+PRIMITIVE_SCHEMAS = {
+    name: {"type": name}
+    for name in ("string", "number", "boolean", "integer", "array", "object", "null")
+}
 
 
 def convert_primitive_types_to_schemas(any_of_array):
@@ -44,7 +40,7 @@ def convert_primitive_types_to_schemas(any_of_array):
     for item in any_of_array:
         if isinstance(item, str):
             # Convert primitive type string to schema object
-            schema_obj = {"type": item}
+            schema_obj = PRIMITIVE_SCHEMAS.get(item) or {"type": item}
             converted.append(schema_obj)
             logger.debug(f"Converted primitive '{item}' to schema object")
         elif isinstance(item, dict):
@@ -56,6 +52,11 @@ def convert_primitive_types_to_schemas(any_of_array):
     return converted
 
 
+def mentions_anyof(obj) -> bool:
+    """Cheap pre-filter: whether the serialized object contains an "anyOf" token."""
+    return b'"anyOf"' in dumps(obj)
+
+
 def fix_anyof_primitive_types(schema_obj: dict) -> tuple:
     """
     Fix anyOf arrays that contain primitive type strings.
@@ -64,6 +65,7 @@ def fix_anyof_primitive_types(schema_obj: dict) -> tuple:
         return schema_obj, 0
 
     fixed_count = 0
+    definitions = schema_obj.get("definitions")
 
     def fix_recursive(obj):
         nonlocal fixed_count
@@ -81,6 +83,9 @@ def fix_anyof_primitive_types(schema_obj: dict) -> tuple:
 
             # Recursively fix nested objects
             for key, value in obj.items():
+                if obj is definitions and not mentions_anyof(value):
+                    # Most definitions have no anyOf at all; skip them without walking
+                    continue
                 if isinstance(value, (dict, list)):
                     fix_recursive(value)
         elif isinstance(obj, list):
@@ -124,8 +129,10 @@ def fix_badge_object_specific(schema: dict) -> dict:
     return schema
 
 
-def main():
+def main(argv=None):
     """Main function to fix primitive types in anyOf arrays."""
+    args = parse_save_args(__doc__, argv)
+
     logger.info("=" * 60)
     logger.info("Fixing Primitive Types in anyOf Arrays")
     logger.info("=" * 60)
@@ -145,7 +152,7 @@ def main():
 
     # Save the fixed schema
     logger.info(f"Saving fixed schema to {SCHEMA_PATH}")
-    save_schema(fixed_schema, SCHEMA_PATH)
+    save_schema(fixed_schema, SCHEMA_PATH, pretty=args.pretty)
 
     logger.info("=" * 60)
     logger.info("✅ Primitive types in anyOf arrays fixed!")
@@ -8,28 +8,17 @@ The comprehensive_badge_fix.py script created invalid JSON Schema structures:
 
 This script fixes these structures to be valid JSON Schema.
 """
-import json
 import logging
 from pathlib import Path
 
+from _json_utils import load_schema, parse_save_args, save_schema
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
 
-def load_schema(path: Path) -> dict:
-    """Load JSON schema from file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_schema(schema: dict, path: Path) -> None:
-    """Save JSON schema to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
-
-
 def fix_malformed_anyof(schema_obj: dict) -> dict:
     """
     Fix malformed anyOf structures that were created by comprehensive_badge_fix.py
@@ -126,8 +115,10 @@ def fix_badge_specific_issues(schema: dict) -> dict:
     return schema
 
 
-def main():
+def main(argv=None):
     """Main function to fix malformed badge validation issues."""
+    args = parse_save_args(__doc__, argv)
+
     logger.info("=" * 60)
     logger.info("Fixing Malformed Badge Schema Structures")
     logger.info("=" * 60)
@@ -147,7 +138,7 @@ def main():
 
     # Save the fixed schema
     logger.info(f"Saving fixed schema to {SCHEMA_PATH}")
-    save_schema(final_schema, SCHEMA_PATH)
+    save_schema(final_schema, SCHEMA_PATH, pretty=args.pretty)
 
     logger.info("=" * 60)
     logger.info("✅ Malformed badge schema structures fixed!")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Single-pass schema fix pipeline for the AMIS schema.
+
+Fuses final_schema_fix, fix_all_badge_fields, fix_all_json_schema_objects and
+fix_anyof_primitive_types: the schema is loaded once, every object is visited
+once by final_schema_fix's iterative walker with the other scripts' fixes
+plugged in as extra mutators, and the result is written once.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+import final_schema_fix
+from _json_utils import load_schema, save_schema
+from fix_all_badge_fields import fix_badge_field_in_properties
+from fix_anyof_primitive_types import convert_primitive_types_to_schemas
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+INPUT_SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_translated.json"
+OUTPUT_SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
+
+JSON_SCHEMA_OBJECT_REF = "#/definitions/JsonSchemaObject"
+OBJECT_REF = "#/definitions/object"
+
+
+def fix_badge_properties(obj: Dict[str, Any]) -> int:
+    """Replace a malformed `badge` entry in this object's properties."""
+    properties = obj.get("properties")
+    if not isinstance(properties, dict):
+        return 0
+    fixes_applied = 0
+    badge = properties.get("badge")
+    if isinstance(badge, dict):
+        # Sequentially the type-list rewrite has already run over the badge
+        # when it is checked, so a `type: [...]` badge is converted, not replaced
+        _, fixes_applied = final_schema_fix.apply_fixes_iterative(badge, set())
+    return fixes_applied + fix_badge_field_in_properties(properties)
+
+
+def fix_json_schema_object_ref(obj: Dict[str, Any]) -> int:
+    """Point references to the removed JsonSchemaObject at the plain object definition."""
+    if obj.get("$ref") == JSON_SCHEMA_OBJECT_REF:
+        obj["$ref"] = OBJECT_REF
+        return 1
+    return 0
+
+
+def fix_anyof_primitives(obj: Dict[str, Any]) -> int:
+    """Expand primitive type strings inside `anyOf` into `{"type": ...}` objects."""
+    any_of = obj.get("anyOf")
+    if isinstance(any_of, list) and any(isinstance(item, str) for item in any_of):
+        obj["anyOf"] = convert_primitive_types_to_schemas(any_of)
+        return 1
+    return 0
+
+
+# Applied after final_schema_fix's type-list rewrite and cyclic $ref wrap, in
+# the order the standalone scripts used to run
+MUTATORS = (fix_badge_properties, fix_json_schema_object_ref, fix_anyof_primitives)
+
+
+def fix_definitions(definitions: Dict[str, Any]) -> int:
+    """Apply the definition-level fixes that the walker cannot express per object."""
+    fixes_applied = final_schema_fix.fix_tplschema_badge(definitions)
+
+    if "JsonSchemaObject" in definitions:
+        logger.info("Removing JsonSchemaObject definition...")
+        del definitions["JsonSchemaObject"]
+        fixes_applied += 1
+    if "object" not in definitions:
+        logger.info("Adding simple object definition...")
+        definitions["object"] = {"type": "object", "additionalProperties": True}
+
+    return fixes_applied
+
+
+def fix_schema(schema: Dict[str, Any]) -> int:
+    """
+    Apply every fix to `schema` in place and return the number of fixes.
+    Cycles are detected before JsonSchemaObject is dropped, as in the
+    sequential pipeline, so refs to it are wrapped and then rewritten.
+    """
+    definitions = schema.setdefault("definitions", {})
+    cyclic_defs = final_schema_fix.find_cyclic_definitions(definitions)
+    total_fixes = fix_definitions(definitions)
+
+    logger.info("Applying all fixes in a single, non-recursive pass...")
+    _, walk_fixes = final_schema_fix.apply_fixes_iterative(schema, cyclic_defs, MUTATORS)
+    return total_fixes + walk_fixes
+
+
+def main() -> int:
+    """Main function to run the fused schema fix pipeline."""
+    logger.info("=" * 70)
+    logger.info("AMIS Schema Fix Pipeline (single pass)")
+    logger.info("=" * 70)
+
+    if not INPUT_SCHEMA_PATH.exists():
+        logger.error(f"Input schema not found: {INPUT_SCHEMA_PATH}")
+        return 1
+
+    logger.info(f"Loading schema from: {INPUT_SCHEMA_PATH}")
+    schema = load_schema(INPUT_SCHEMA_PATH)
+    total_fixes = fix_schema(schema)
+
+    logger.info(f"Saving fixed schema to: {OUTPUT_SCHEMA_PATH}")
+    save_schema(schema, OUTPUT_SCHEMA_PATH, pretty=True)
+
+    logger.info("\n" + "=" * 70)
+    logger.info("✅ Schema fixes complete!")
+    logger.info(f"Total fixes applied: {total_fixes}")
+    logger.info(f"Output written to: {OUTPUT_SCHEMA_PATH}")
+    logger.info("=" * 70)
+
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -9,24 +9,14 @@ import json
 import logging
 from pathlib import Path
 
+from _json_utils import load_schema, parse_save_args, save_schema
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "schema_simplified.json"
 
 
-def load_schema(path: Path) -> dict:
-    """Load JSON schema from file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_schema(schema: dict, path: Path) -> None:
-    """Save JSON schema to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
-
-
 def fix_tplschema_json_schema_object(schema: dict) -> dict:
     """
     Fix the specific JsonSchemaObject nesting issue in TplSchema badge field.
@@ -78,8 +68,10 @@ def fix_tplschema_json_schema_object(schema: dict) -> dict:
     return schema
 
 
-def main():
+def main(argv=None):
     """Main function to fix the specific TplSchema JsonSchemaObject issue."""
+    args = parse_save_args(__doc__, argv)
+
     logger.info("=" * 60)
     logger.info("Fixing TplSchema JsonSchemaObject Issue")
     logger.info("=" * 60)
@@ -94,7 +86,7 @@ def main():
 
     # Save the fixed schema
     logger.info(f"Saving fixed schema to {SCHEMA_PATH}")
-    save_schema(fixed_schema, SCHEMA_PATH)
+    save_schema(fixed_schema, SCHEMA_PATH, pretty=args.pretty)
 
     logger.info("=" * 60)
     logger.info("✅ TplSchema JsonSchemaObject issue fixed!")
@@ -29,6 +29,7 @@ DEFAULT_OUTPUT_PATH = (
     / "amis"
     / "auto_generated_models.py"
 )
+MANIFEST_NAME = "_manifest.txt"
 
 
 def check_dependencies() -> bool:
@@ -207,6 +208,30 @@ def validate_generated_code(output_path: Path) -> bool:
         return False
 
 
+def write_manifest(output_path: Path) -> Path:
+    """
+    Write the list of model names defined in the generated file.
+
+    The manifest lets ``fastapi_amis_admin.amis`` expose every model name
+    without importing the generated module until a model is actually used.
+
+    Args:
+        output_path: Path to the generated Python file.
+
+    Returns:
+        Path: Path to the written manifest file.
+    """
+    with open(output_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    names = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    manifest_path = output_path.with_name(MANIFEST_NAME)
+    manifest_path.write_text("\n".join(names) + "\n", encoding="utf-8")
+
+    logger.info(f"Model manifest written: {manifest_path} ({len(names)} names)")
+    return manifest_path
+
+
 def main(
     schema_path: Optional[Path] = None, output_path: Optional[Path] = None
 ) -> int:
@@ -283,6 +308,9 @@ def main(
         except Exception as e:
             logger.warning(f"Could not fix enum duplicates: {e}")
 
+        # Record model names for lazy loading in fastapi_amis_admin.amis
+        write_manifest(output_path)
+
         logger.info("=" * 60)
         logger.info("✅ Models generated and validated successfully!")
         logger.info(f"Location: {output_path.absolute()}")
@@ -28,7 +28,7 @@ def resolve_ref(ref: str, definitions: Dict[str, Any]) -> Any:
     """Resolve a $ref reference."""
     if not ref.startswith("#/definitions/"):
         return None
-    def_name = ref.split("/")[-1]
+    def_name = ref.rsplit("/", 1)[-1]
     return definitions.get(def_name)
 
 
@@ -61,7 +61,7 @@ def get_properties_from_allof(
                 # Resolve $ref if present
                 if "$ref" in item:
                     ref = item["$ref"]
-                    def_name = ref.split("/")[-1] if "/" in ref else ref
+                    def_name = ref.rsplit("/", 1)[-1] if "/" in ref else ref
                     if def_name not in visited:
                         visited.add(def_name)
                         resolved = resolve_ref(ref, definitions)
@@ -45,7 +45,7 @@ def resolve_ref(ref: str, definitions: Dict[str, Any]) -> Any:
     if not ref.startswith("#/definitions/"):
         return None
     
-    def_name = ref.split("/")[-1]
+    def_name = ref.rsplit("/", 1)[-1]
     return definitions.get(def_name)
 
 
@@ -132,7 +132,7 @@ def resolve_true_property_from_allof(
         # Check $ref in allOf
         if "$ref" in allof_item:
             ref = allof_item["$ref"]
-            def_name = ref.split("/")[-1] if "/" in ref else ref
+            def_name = ref.rsplit("/", 1)[-1] if "/" in ref else ref
             
             if def_name not in visited:
                 visited.add(def_name)
@@ -221,7 +221,7 @@ def simplify_schema_recursive(
         # Handle $ref
         if "$ref" in obj:
             ref = obj["$ref"]
-            def_name = ref.split("/")[-1] if "/" in ref else ref
+            def_name = ref.rsplit("/", 1)[-1] if "/" in ref else ref
             
             # Detect circular reference
             if def_name in visited:
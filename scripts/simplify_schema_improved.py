@@ -65,7 +65,7 @@ def resolve_ref(ref: str, definitions: Dict[str, Any]) -> Any:
     if not ref.startswith("#/definitions/"):
         return None
     
-    def_name = ref.split("/")[-1]
+    def_name = ref.rsplit("/", 1)[-1]
     return definitions.get(def_name)
 
 
@@ -148,7 +148,7 @@ def simplify_schema_recursive(
         # Handle $ref - resolve but preserve structure
         if "$ref" in obj:
             ref = obj["$ref"]
-            def_name = ref.split("/")[-1] if "/" in ref else ref
+            def_name = ref.rsplit("/", 1)[-1] if "/" in ref else ref
             
             # Detect circular reference
             if def_name in visited:
@@ -7,10 +7,11 @@ requiring external translation libraries.
 """
 import json
 import logging
-import re
 from pathlib import Path
 from typing import Any, Dict
 
+import _cjk_utils
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -193,7 +194,7 @@ def contains_chinese(text: str) -> bool:
     """Check if text contains Chinese characters."""
     if not isinstance(text, str):
         return False
-    return bool(re.search(r'[\u4e00-\u9fff]', text))
+    return _cjk_utils.contains_chinese(text)
 
 
 def translate_text(text: str) -> str:
@@ -278,7 +279,7 @@ def main():
     
     # Count Chinese strings
     schema_str = json.dumps(schema, ensure_ascii=False)
-    chinese_count = len(re.findall(r'[\u4e00-\u9fff]', schema_str))
+    chinese_count = _cjk_utils.count_chinese(schema_str)
     logger.info(f"Found ~{chinese_count} Chinese characters")
     
     # Translate schema
@@ -292,7 +293,7 @@ def main():
     
     # Verify translation
     translated_str = json.dumps(translated_schema, ensure_ascii=False)
-    remaining_chinese = len(re.findall(r'[\u4e00-\u9fff]', translated_str))
+    remaining_chinese = _cjk_utils.count_chinese(translated_str)
     
     logger.info("=" * 60)
     logger.info(f"✅ Translation complete!")
@@ -1,7 +1,7 @@
 """Tests for download_schema.py script."""
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
@@ -18,7 +18,7 @@ import download_schema
 class TestGetLatestReleaseInfo:
     """Test get_latest_release_info function."""
 
-    @patch("download_schema.requests.get")
+    @patch("download_schema._SESSION.get")
     def test_success(self, mock_get):
         """Test successful API call."""
         mock_response = Mock()
@@ -31,18 +31,23 @@ class TestGetLatestReleaseInfo:
         assert result["tag_name"] == "v6.13.0"
         mock_get.assert_called_once()
 
-    @patch("download_schema.requests.get")
-    def test_retry_on_failure(self, mock_get):
-        """Test retry logic on network failure."""
-        mock_get.side_effect = [
-            requests.RequestException("Network error"),
-            requests.RequestException("Network error"),
-            Mock(json=lambda: {"tag_name": "v6.13.0"}),
-        ]
+    def test_session_retries_transient_failures(self):
+        """Test that the shared session retries GETs with backoff."""
+        retry = download_schema._SESSION.get_adapter("https://api.github.com").max_retries
 
-        # Should succeed on third attempt
-        result = download_schema.get_latest_release_info()
-        assert result["tag_name"] == "v6.13.0"
+        assert retry.total == download_schema.MAX_RETRIES
+        assert retry.backoff_factor > 0
+        assert 503 in retry.status_forcelist
+        assert "GET" in retry.allowed_methods
+
+    @patch("download_schema._SESSION.get")
+    def test_failure_propagates(self, mock_get):
+        """Test that errors left after the adapter's retries are raised."""
+        mock_get.side_effect = requests.RequestException("Network error")
+
+        with pytest.raises(requests.RequestException):
+            download_schema.get_latest_release_info()
+        mock_get.assert_called_once()
 
 
 class TestFindSchemaAsset:
@@ -103,16 +108,25 @@ class TestValidateSchema:
 
         assert download_schema.validate_schema(schema_path) is False
 
+    def test_invalid_json_after_root_keys(self, tmp_path):
+        """Test validation reads past the top-level keys to find syntax errors."""
+        schema_path = tmp_path / "schema.json"
+
+        with open(schema_path, "w") as f:
+            f.write('{"$schema": "x", "definitions": {"A": [1,}}')
+
+        assert download_schema.validate_schema(schema_path) is False
+
 
 class TestDownloadFile:
     """Test download_file function."""
 
-    @patch("download_schema.requests.get")
+    @patch("download_schema._SESSION.get")
     def test_successful_download(self, mock_get, tmp_path):
         """Test successful file download."""
-        mock_response = Mock()
-        mock_response.iter_content = Mock(return_value=[b"test data"])
-        mock_response.raise_for_status = Mock()
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = [b"test data"]
         mock_get.return_value = mock_response
 
         output_path = tmp_path / "test.json"
@@ -121,12 +135,12 @@ class TestDownloadFile:
         assert output_path.exists()
         assert output_path.read_bytes() == b"test data"
 
-    @patch("download_schema.requests.get")
+    @patch("download_schema._SESSION.get")
     def test_creates_parent_directory(self, mock_get, tmp_path):
         """Test that parent directories are created."""
-        mock_response = Mock()
-        mock_response.iter_content = Mock(return_value=[b"data"])
-        mock_response.raise_for_status = Mock()
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = [b"data"]
         mock_get.return_value = mock_response
 
         output_path = tmp_path / "subdir" / "nested" / "file.json"
@@ -135,6 +149,86 @@ class TestDownloadFile:
         assert output_path.exists()
         assert output_path.parent.exists()
 
+    @patch("download_schema._SESSION.get")
+    def test_sends_etag_and_returns_new_one(self, mock_get, tmp_path):
+        """Test that the stored ETag is sent and the response ETag returned."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"new"'}
+        mock_response.iter_content.return_value = [b"data"]
+        mock_get.return_value = mock_response
+
+        output_path = tmp_path / "file.json"
+        result = download_schema.download_file("https://example.com/file", output_path, etag='"old"')
+
+        assert result == (True, '"new"')
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"old"'}
+
+    @patch("download_schema._SESSION.get")
+    def test_not_modified_keeps_existing_file(self, mock_get, tmp_path):
+        """Test that a 304 response leaves the existing file untouched."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        output_path = tmp_path / "file.json"
+        output_path.write_bytes(b"cached")
+        result = download_schema.download_file("https://example.com/file", output_path, etag='"abc"')
+
+        assert result == (False, '"abc"')
+        assert output_path.read_bytes() == b"cached"
+
+    @patch("download_schema._SESSION.get")
+    def test_failed_download_drops_stale_etag(self, mock_get, tmp_path):
+        """Test that the old ETag is removed before the file is overwritten."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.iter_content.side_effect = requests.HTTPError("bad body")
+        mock_get.return_value = mock_response
+
+        output_path = tmp_path / "file.json"
+        output_path.write_bytes(b"cached")
+        download_schema.etag_path(output_path).write_text('"old"')
+
+        with pytest.raises(requests.HTTPError):
+            download_schema.download_file("https://example.com/file", output_path, etag='"old"')
+        assert download_schema.read_etag(output_path) is None
+
+    @patch("download_schema.time.sleep")
+    @patch("download_schema._SESSION.get")
+    def test_retries_interrupted_stream(self, mock_get, mock_sleep, tmp_path):
+        """Test that a body that fails mid-stream is downloaded again."""
+        broken = MagicMock()
+        broken.__enter__.return_value = broken
+        broken.iter_content.side_effect = requests.exceptions.ChunkedEncodingError("reset")
+        complete = MagicMock()
+        complete.__enter__.return_value = complete
+        complete.iter_content.return_value = [b"full data"]
+        mock_get.side_effect = [broken, complete]
+
+        output_path = tmp_path / "file.json"
+        download_schema.download_file("https://example.com/file", output_path)
+
+        assert output_path.read_bytes() == b"full data"
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("download_schema.time.sleep")
+    @patch("download_schema._SESSION.get")
+    def test_gives_up_after_max_retries(self, mock_get, mock_sleep, tmp_path):
+        """Test that the last stream error is raised once retries run out."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.side_effect = requests.Timeout("stalled")
+        mock_get.return_value = mock_response
+
+        with pytest.raises(requests.Timeout):
+            download_schema.download_file("https://example.com/file", tmp_path / "file.json")
+        assert mock_get.call_count == download_schema.MAX_RETRIES + 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
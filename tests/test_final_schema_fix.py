@@ -0,0 +1,50 @@
+"""Tests for final_schema_fix.py script."""
+from pathlib import Path
+
+# Add scripts to path
+import sys
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import final_schema_fix
+
+
+class TestFindCyclicDefinitions:
+    """Test find_cyclic_definitions function."""
+
+    def test_mutual_and_self_references(self):
+        """Test that only definitions on a cycle are reported."""
+        definitions = {
+            "A": {"properties": {"b": {"$ref": "#/definitions/B"}}},
+            "B": {"items": [{"$ref": "#/definitions/A"}]},
+            "C": {"$ref": "#/definitions/C"},
+            "D": {"properties": {"a": {"$ref": "#/definitions/A"}}},
+        }
+
+        assert final_schema_fix.find_cyclic_definitions(definitions) == {"A", "B", "C"}
+
+
+class TestApplyFixesIterative:
+    """Test apply_fixes_iterative function."""
+
+    def test_cyclic_ref_wrapped_once(self):
+        """Test that a cyclic $ref is wrapped exactly once and the pass terminates."""
+        schema = {
+            "definitions": {
+                "Node": {
+                    "properties": {
+                        "child": {"$ref": "#/definitions/Node"},
+                        "value": {"type": ["string", "number"]},
+                    }
+                }
+            }
+        }
+        cyclic = final_schema_fix.find_cyclic_definitions(schema["definitions"])
+
+        result, fixes = final_schema_fix.apply_fixes_iterative(schema, cyclic)
+
+        properties = result["definitions"]["Node"]["properties"]
+        assert properties["child"] == {"anyOf": [{"$ref": "#/definitions/Node"}]}
+        assert properties["value"] == {"anyOf": [{"type": "string"}, {"type": "number"}]}
+        assert fixes == 2
@@ -0,0 +1,117 @@
+"""Tests for fix_schema.py script."""
+from pathlib import Path
+
+# Add scripts to path
+import sys
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import final_schema_fix
+import fix_all_badge_fields
+import fix_all_json_schema_objects
+import fix_anyof_primitive_types
+import fix_schema
+
+
+def make_schema() -> dict:
+    """Small schema exercising every fix the pipeline applies."""
+    return {
+        "$ref": "#/definitions/RootSchema",
+        "definitions": {
+            "RootSchema": {
+                "properties": {
+                    "body": {"$ref": "#/definitions/RootSchema"},
+                    "size": {"type": ["string", "number"]},
+                    "extra": {"$ref": "#/definitions/JsonSchemaObject"},
+                    "badge": True,
+                }
+            },
+            "JsonSchemaObject": {
+                "properties": {"items": {"$ref": "#/definitions/JsonSchemaObject"}}
+            },
+            "TplSchema": {
+                "allOf": [
+                    {"properties": {"badge": {"type": "object"}}},
+                ]
+            },
+            "ButtonSchema": {
+                "allOf": [
+                    {"properties": {"badge": {"type": ["string", "number"]}}},
+                    {
+                        "properties": {
+                            "badge": {
+                                "properties": {
+                                    "offset": {"type": "array", "items": {"type": {"a": 1}}},
+                                }
+                            }
+                        }
+                    },
+                ]
+            },
+            "BadgeObject": {
+                "properties": {
+                    "text": {"anyOf": ["string", "number"]},
+                    "offset": {"items": {"anyOf": ["number", "string"]}},
+                }
+            },
+        },
+    }
+
+
+def run_sequential(schema: dict) -> dict:
+    """Run the four standalone scripts' fixes one after another."""
+    definitions = schema["definitions"]
+    cyclic_defs = final_schema_fix.find_cyclic_definitions(definitions)
+    final_schema_fix.apply_fixes_iterative(schema, cyclic_defs)
+    final_schema_fix.fix_tplschema_badge(definitions)
+    fix_all_badge_fields.fix_all_badge_fields(schema)
+    schema = fix_all_json_schema_objects.fix_all_json_schema_object_issues(schema)
+    schema = fix_anyof_primitive_types.fix_badge_object_specific(schema)
+    schema, _ = fix_anyof_primitive_types.fix_anyof_primitive_types(schema)
+    return schema
+
+
+class TestFixSchema:
+    """Test fix_schema function."""
+
+    def test_matches_sequential_scripts(self):
+        """Test that the fused pass gives the same schema as the scripts run in sequence."""
+        fused = make_schema()
+        fix_schema.fix_schema(fused)
+
+        assert fused == run_sequential(make_schema())
+
+    def test_fixes_applied(self):
+        """Test the individual fixes in the fused output."""
+        schema = make_schema()
+        fix_schema.fix_schema(schema)
+        definitions = schema["definitions"]
+        root = definitions["RootSchema"]["properties"]
+        badge = fix_all_badge_fields.create_valid_badge_object()
+
+        assert "JsonSchemaObject" not in definitions
+        assert definitions["object"] == {"type": "object", "additionalProperties": True}
+        assert root["body"] == {"anyOf": [{"$ref": "#/definitions/RootSchema"}]}
+        assert root["size"] == {"anyOf": [{"type": "string"}, {"type": "number"}]}
+        # JsonSchemaObject is cyclic, so its ref is wrapped first and then rewritten
+        assert root["extra"] == {"anyOf": [{"$ref": "#/definitions/object"}]}
+        assert root["badge"] == badge
+        assert definitions["TplSchema"]["allOf"][0]["properties"]["badge"] == badge
+        button = definitions["ButtonSchema"]["allOf"]
+        # A `type: [...]` badge is converted to anyOf, not replaced
+        assert button[0]["properties"]["badge"] == {"anyOf": [{"type": "string"}, {"type": "number"}]}
+        assert button[1]["properties"]["badge"] == badge
+        assert definitions["BadgeObject"]["properties"]["text"] == {
+            "anyOf": [{"type": "string"}, {"type": "number"}]
+        }
+
+    def test_badge_objects_are_not_shared(self):
+        """Test that each replaced badge field is its own object."""
+        schema = make_schema()
+        fix_schema.fix_schema(schema)
+        definitions = schema["definitions"]
+
+        root_badge = definitions["RootSchema"]["properties"]["badge"]
+        tpl_badge = definitions["TplSchema"]["allOf"][0]["properties"]["badge"]
+        assert root_badge is not tpl_badge
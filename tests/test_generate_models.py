@@ -130,5 +130,62 @@ class TestAddHeaderComment:
         assert original_content in content
 
 
+class TestWriteManifest:
+    """Test write_manifest function."""
+
+    def test_lists_top_level_classes(self, tmp_path):
+        """Test that only top-level class names are written."""
+        output_path = tmp_path / "models.py"
+        output_path.write_text(
+            """
+from enum import Enum
+
+from pydantic import BaseModel
+
+class Size(Enum):
+    sm = 'sm'
+
+class Page(BaseModel):
+    class Config:
+        pass
+
+    title: str
+"""
+        )
+
+        manifest_path = generate_models.write_manifest(output_path)
+
+        assert manifest_path == tmp_path / "_manifest.txt"
+        assert manifest_path.read_text().split() == ["Size", "Page"]
+
+    def test_committed_manifest_matches_models(self, tmp_path):
+        """Test that the shipped manifest lists exactly the generated models."""
+        package_dir = SCRIPTS_DIR.parent / "fastapi_amis_admin" / "amis"
+        output_path = tmp_path / "auto_generated_models.py"
+        output_path.write_bytes((package_dir / "auto_generated_models.py").read_bytes())
+
+        manifest_path = generate_models.write_manifest(output_path)
+
+        committed = (package_dir / generate_models.MANIFEST_NAME).read_text(encoding="utf-8")
+        assert committed.split() == manifest_path.read_text(encoding="utf-8").split()
+
+
+class TestLazyModels:
+    """Test lazy model access in fastapi_amis_admin.amis."""
+
+    def test_name_missing_from_manifest(self, monkeypatch):
+        """Test that a model left out of a stale manifest is still importable."""
+        monkeypatch.syspath_prepend(str(SCRIPTS_DIR.parent))
+        amis = pytest.importorskip("fastapi_amis_admin.amis")
+        from fastapi_amis_admin.amis import auto_generated_models
+
+        monkeypatch.setattr(amis, "_LAZY_NAMES", frozenset())
+        monkeypatch.delitem(vars(amis), "Messages", raising=False)
+
+        assert amis.Messages is auto_generated_models.Messages
+        with pytest.raises(AttributeError):
+            amis.NotAModel
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
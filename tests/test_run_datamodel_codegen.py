@@ -0,0 +1,82 @@
+"""Tests for run_datamodel_codegen.py post-processing."""
+import ast
+from pathlib import Path
+
+import pytest
+
+# Add repo root to path
+import sys
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+pytest.importorskip("datamodel_code_generator")
+
+import run_datamodel_codegen
+
+GENERATED = '''\
+from enum import Enum
+from typing import List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class SchemaType(Enum):
+    """
+    组件类型
+    """
+
+    page = 'page'
+    form = 'form'
+
+
+class PageSchema(BaseModel):
+    type: SchemaType = Field(..., description='页面')
+    body: Union[SchemaType, List[SchemaType]] = Field(
+        None, description='内容区域'
+    )
+    parent: Optional['SchemaType'] = None
+    kind: str = SchemaType.page
+
+
+def schema_type_of(value: SchemaType) -> SchemaType:
+    return value
+'''
+
+
+class TestPatchSchemaTypeEnum:
+    """Test _patch_schema_type_enum function."""
+
+    def test_replaces_enum_and_every_annotation(self, tmp_path):
+        """Test that every SchemaType annotation use is rewritten, not only the first per line."""
+        output_path = tmp_path / "models.py"
+        output_path.write_text(GENERATED, encoding="utf-8")
+
+        run_datamodel_codegen._patch_schema_type_enum(output_path)
+
+        content = output_path.read_text(encoding="utf-8")
+        ast.parse(content)
+        assert "class SchemaType(Enum)" not in content
+        assert "SchemaTypeLiteral = Literal[\n    'page',\n    'form',\n]" in content
+        assert "class SchemaType:\n    page = 'page'\n    form = 'form'\n" in content
+        assert "    type: SchemaTypeLiteral = Field(..., description='页面')" in content
+        assert "    body: Union[SchemaTypeLiteral, List[SchemaTypeLiteral]] = Field(" in content
+        assert "    parent: Optional['SchemaTypeLiteral'] = None" in content
+        # Defaults still refer to the constants class
+        assert "    kind: str = SchemaType.page" in content
+        assert "def schema_type_of(value: SchemaTypeLiteral) -> SchemaTypeLiteral:" in content
+        # The docstring's blank line did not cut the enum short
+        assert "组件类型" not in content
+
+    def test_no_enum_leaves_file_unchanged(self, tmp_path):
+        """Test that files without the enum are left alone."""
+        output_path = tmp_path / "models.py"
+        output_path.write_text("class Page:\n    type: str\n", encoding="utf-8")
+
+        run_datamodel_codegen._patch_schema_type_enum(output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "class Page:\n    type: str\n"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
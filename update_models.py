@@ -23,7 +23,7 @@ import download_schema
 import translate_schema
 import generate_models
 import clean_chinese
-import final_schema_fix
+import fix_schema
 
 # Configure logging
 logging.basicConfig(
@@ -65,7 +65,7 @@ def main() -> int:
         # Step 3: Fix and standardize the schema
         logger.info("\n🔧 Step 3: Fixing and standardizing the schema...")
         logger.info("-" * 70)
-        exit_code = final_schema_fix.main()
+        exit_code = fix_schema.main()
         if exit_code != 0:
             logger.error("❌ Schema fixing failed!")
             return exit_code